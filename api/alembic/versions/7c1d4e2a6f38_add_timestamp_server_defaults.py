@@ -0,0 +1,57 @@
+"""add_timestamp_server_defaults
+
+Revision ID: 7c1d4e2a6f38
+Revises: 3b7e5f0c9a21
+Create Date: 2026-10-16 10:41:07.915362
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1d4e2a6f38"
+down_revision: Union[str, None] = "3b7e5f0c9a21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMPED_TABLES = [
+    "user",
+    "category",
+    "author",
+    "book",
+    "review",
+    "discount",
+    "order",
+    "order_item",
+    "blacklistedtoken",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TIMESTAMPED_TABLES:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=sa.text("now()"),
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TIMESTAMPED_TABLES:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None,
+            )
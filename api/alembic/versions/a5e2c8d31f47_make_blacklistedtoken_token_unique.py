@@ -0,0 +1,43 @@
+"""make_blacklistedtoken_token_unique
+
+Revision ID: a5e2c8d31f47
+Revises: 7c1d4e2a6f38
+Create Date: 2026-10-16 11:04:52.731904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a5e2c8d31f47"
+down_revision: Union[str, None] = "7c1d4e2a6f38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Concurrent logouts could insert the same token twice; keep the oldest row
+    op.execute(
+        """
+        DELETE FROM blacklistedtoken a
+        USING blacklistedtoken b
+        WHERE a.token = b.token AND a.id > b.id
+        """
+    )
+    op.drop_index(op.f("ix_blacklistedtoken_token"), table_name="blacklistedtoken")
+    op.create_index(
+        op.f("ix_blacklistedtoken_token"), "blacklistedtoken", ["token"], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_blacklistedtoken_token"), table_name="blacklistedtoken")
+    op.create_index(
+        op.f("ix_blacklistedtoken_token"), "blacklistedtoken", ["token"], unique=False
+    )
@@ -0,0 +1,51 @@
+"""add_book_rating_view
+
+Revision ID: a7c4e1f9b3d6
+Revises: f2b8d5e7c3a4
+Create Date: 2026-10-16 18:11:37.240519
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c4e1f9b3d6"
+down_revision: Union[str, None] = "f2b8d5e7c3a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Review statistics per reviewed book as of the last refresh; the
+    # application refreshes it periodically
+    op.execute("""
+        CREATE MATERIALIZED VIEW book_rating AS
+        SELECT
+            review.book_id,
+            avg(review.rating) AS avg_rating,
+            count(review.id) AS review_count
+        FROM review
+        GROUP BY review.book_id
+        """)
+    # REFRESH ... CONCURRENTLY requires a unique index
+    op.create_index(
+        "ix_book_rating_book_id",
+        "book_rating",
+        ["book_id"],
+        unique=True,
+    )
+    # Matches the recommended books ORDER BY, so the top N are read off the index
+    op.create_index(
+        "ix_book_rating_ranking",
+        "book_rating",
+        [sa.text("avg_rating DESC"), "book_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW book_rating")
@@ -0,0 +1,37 @@
+"""cover_review_rating_index
+
+Revision ID: b5d9e3a7c218
+Revises: a7c4e1f9b3d6
+Create Date: 2026-10-16 18:47:52.618034
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d9e3a7c218"
+down_revision: Union[str, None] = "a7c4e1f9b3d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_review_book_id_rating",
+        "review",
+        ["book_id"],
+        unique=False,
+        postgresql_include=["rating"],
+    )
+    op.drop_index("ix_review_book_id", table_name="review")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_review_book_id", "review", ["book_id"], unique=False)
+    op.drop_index("ix_review_book_id_rating", table_name="review")
@@ -0,0 +1,59 @@
+"""add_top_discounted_book_view
+
+Revision ID: c3e9a1f5d27b
+Revises: b8d2f6a4c913
+Create Date: 2026-10-16 14:02:41.906217
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e9a1f5d27b"
+down_revision: Union[str, None] = "b8d2f6a4c913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Best active discount per book as of the last refresh; the application
+    # refreshes it periodically and after discount changes
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW top_discounted_book AS
+        SELECT
+            discount.book_id,
+            max(book.book_price - discount.discount_price) AS discount_amount,
+            min(discount.discount_price) AS best_discount_price
+        FROM discount
+        JOIN book ON discount.book_id = book.id
+        WHERE (discount.discount_start_date IS NULL
+               OR discount.discount_start_date <= CURRENT_DATE)
+          AND (discount.discount_end_date IS NULL
+               OR discount.discount_end_date >= CURRENT_DATE)
+        GROUP BY discount.book_id
+        """
+    )
+    # REFRESH ... CONCURRENTLY requires a unique index
+    op.create_index(
+        "ix_top_discounted_book_book_id",
+        "top_discounted_book",
+        ["book_id"],
+        unique=True,
+    )
+    # Matches the endpoint's ORDER BY, so the top N are read off the index
+    op.create_index(
+        "ix_top_discounted_book_ranking",
+        "top_discounted_book",
+        [sa.text("discount_amount DESC"), "best_discount_price", "book_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW top_discounted_book")
@@ -1,8 +1,12 @@
 import random
-from datetime import datetime, timedelta
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
 from decimal import Decimal
 
 from faker import Faker
+from psycopg import sql
+from sqlalchemy import Row, insert, text
 from sqlmodel import Session, SQLModel, create_engine, delete
 
 from src.auth.models import User
@@ -24,13 +28,36 @@ NUM_REVIEWS_PER_BOOK = 50
 NUM_DISCOUNTS = 30
 NUM_ORDERS = 30
 MAX_ITEMS_PER_ORDER = 5
-
-fake = Faker()
+# Distinct values generated for costly free-text fields, then sampled per row
+TEXT_POOL_SIZE = 200
+# Admin flag choices for seeded users; lower chance of admin
+ADMIN_CHOICES = (True, False, False)
+# Use a common password for simplicity
+SEED_PASSWORD = "testing1"
+
+# Load only the providers the seeders use; unweighted locale data is cheaper
+fake = Faker(
+    "en_US",
+    providers=[
+        "faker.providers.company",
+        "faker.providers.date_time",
+        "faker.providers.internet",
+        "faker.providers.lorem",
+        "faker.providers.person",
+    ],
+    use_weighting=False,
+)
+
+# Rows per multi-VALUES INSERT batch; stays under the 65535 bind parameter
+# limit for the widest seeded table
+INSERT_PAGE_SIZE = 5000
 
 # Database setup
 engine = create_engine(
-    settings.DATABASE_URL, echo=False
-)  # Use DATABASE_URL from settings
+    settings.DATABASE_URL,  # Use DATABASE_URL from settings
+    echo=False,
+    insertmanyvalues_page_size=INSERT_PAGE_SIZE,
+)
 
 
 def clear_data(session: Session):
@@ -45,137 +72,305 @@ def clear_data(session: Session):
     session.exec(delete(Author))
     session.exec(delete(Category))
     session.exec(delete(User))
-    session.commit()
     print("Existing data cleared.")
 
 
+SEEDED_TABLES = [
+    model.__tablename__
+    for model in (User, Category, Author, Book, Review, Discount, Order, OrderItem)
+]
+
+# Non-unique secondary indexes on the seeded tables. Unique indexes stay in
+# place, whether they back a constraint or not, so duplicates fail on insert
+SELECT_SECONDARY_INDEXES = text(
+    """
+    SELECT quote_ident(index_class.relname), pg_get_indexdef(ix.indexrelid)
+    FROM pg_index ix
+    JOIN pg_class index_class ON index_class.oid = ix.indexrelid
+    JOIN pg_class table_class ON table_class.oid = ix.indrelid
+    WHERE table_class.relnamespace = current_schema()::regnamespace
+      AND table_class.relname = ANY(:tables)
+      AND NOT ix.indisunique
+      AND NOT EXISTS (
+          SELECT 1 FROM pg_constraint con WHERE con.conindid = ix.indexrelid
+      )
+    """
+)
+
+SELECT_FOREIGN_KEYS = text(
+    """
+    SELECT quote_ident(table_class.relname), quote_ident(con.conname),
+           pg_get_constraintdef(con.oid)
+    FROM pg_constraint con
+    JOIN pg_class table_class ON table_class.oid = con.conrelid
+    WHERE con.contype = 'f'
+      AND table_class.relnamespace = current_schema()::regnamespace
+      AND table_class.relname = ANY(:tables)
+    """
+)
+
+
+def drop_indexes_and_foreign_keys(session: Session) -> list[str]:
+    """Drops secondary indexes and foreign keys on the seeded tables.
+
+    Building an index once after the load is cheaper than maintaining it on
+    every inserted row. Definitions are read from the catalog so they are
+    recreated exactly as the migrations left them.
+
+    Returns:
+        The DDL statements that recreate the dropped indexes and foreign keys.
+    """
+    params = {"tables": SEEDED_TABLES}
+    indexes = session.execute(SELECT_SECONDARY_INDEXES, params).all()
+    foreign_keys = session.execute(SELECT_FOREIGN_KEYS, params).all()
+
+    for table, name, _ in foreign_keys:
+        session.execute(text(f"ALTER TABLE {table} DROP CONSTRAINT {name}"))
+    for name, _ in indexes:
+        session.execute(text(f"DROP INDEX {name}"))
+
+    return [definition for _, definition in indexes] + [
+        f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}"
+        for table, name, definition in foreign_keys
+    ]
+
+
+def restore_indexes_and_foreign_keys(session: Session, statements: list[str]) -> None:
+    """Recreates the indexes and foreign keys dropped before seeding."""
+    for statement in statements:
+        session.execute(text(statement))
+
+
+class SeedWriter:
+    """Runs database writes for the seeders on a single background thread.
+
+    Seeders hand finished rows to the writer and go on generating the next
+    table while the database works. Writes run one at a time in submission
+    order, so the shared session (and its single transaction) is never used
+    from two threads at once.
+    """
+
+    def __init__(self, session: Session):
+        """Initializes SeedWriter.
+
+        Args:
+            session: The session every write is executed with.
+        """
+        self.session = session
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending: list[Future] = []
+
+    def submit(self, write: Callable, *args) -> Future:
+        """Queues `write(session, *args)` behind the previously queued writes."""
+        future = self._executor.submit(write, self.session, *args)
+        self._pending.append(future)
+        return future
+
+    def wait(self) -> None:
+        """Blocks until every queued write is done, re-raising the first error."""
+        for future in self._pending:
+            future.result()
+        self._pending.clear()
+
+    def shutdown(self) -> None:
+        """Drops writes that have not started and waits for the running one."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def insert_returning_ids(
+    session: Session, model: type[SQLModel], rows: list[dict]
+) -> list[Row]:
+    """Bulk inserts rows for a model and returns their generated ids."""
+    return session.execute(insert(model).returning(model.id), rows).all()
+
+
+def text_pool(generate: Callable[[], str], size: int = TEXT_POOL_SIZE) -> list[str]:
+    """Pre-generates fake strings to be sampled with `random.choice`."""
+    return [generate() for _ in range(size)]
+
+
+def reserve_ids(session: Session, table: str, count: int) -> list[int]:
+    """Draws `count` primary keys from a table's id sequence up front.
+
+    Rows streamed through COPY cannot use RETURNING, so ids that later seeders
+    depend on are allocated before the rows are written.
+    """
+    statement = text(
+        "SELECT nextval(pg_get_serial_sequence(:table, 'id'))"
+        " FROM generate_series(1, :count)"
+    )
+    return session.scalars(statement, {"table": table, "count": count}).all()
+
+
+def copy_rows(session: Session, table: str, rows: list[dict]) -> None:
+    """Streams rows into a table with COPY FROM STDIN.
+
+    All rows must share the keys of the first row, which name the columns.
+    """
+    if not rows:
+        return
+    columns = list(rows[0])
+    statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(table), sql.SQL(", ").join(map(sql.Identifier, columns))
+    )
+    dbapi_connection = session.connection().connection
+    with dbapi_connection.cursor() as cursor, cursor.copy(statement) as copy:
+        for row in rows:
+            copy.write_row([row[column] for column in columns])
+
+
 # def create_db_and_tables():
 #     """Creates database tables."""
 #     SQLModel.metadata.create_all(engine)
 
 
-def seed_users(session: Session):
-    """Seeds the database with fake users."""
-    users = []
+def seed_users(writer: SeedWriter) -> Future[list[Row]]:
+    """Seeds the database with fake users.
+
+    Returns:
+        A future resolving to the inserted users' ids.
+    """
+    # bcrypt is deliberately slow, so hash the shared password once
+    hashed_password = get_password_hash(SEED_PASSWORD)
+    rows = []
     for _ in range(NUM_USERS):
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        email = fake.unique.email()
-        password = "testing1"  # Use a common password for simplicity
-        hashed_password = get_password_hash(password)
-        is_admin = random.choice([True, False, False])  # Lower chance of admin
-        user = User(
-            first_name=first_name,
-            last_name=last_name,
-            email=email,
-            hashed_password=hashed_password,
-            admin=is_admin,
-            created_at=fake.date_time_this_decade(),
-            updated_at=datetime.now(),
+        rows.append(
+            {
+                "first_name": fake.first_name(),
+                "last_name": fake.last_name(),
+                "email": fake.unique.email(),
+                "hashed_password": hashed_password,
+                "admin": random.choice(ADMIN_CHOICES),
+                "created_at": fake.date_time_this_decade(),
+            }
         )
-        users.append(user)
-    session.add_all(users)
-    session.commit()
-    print(f"Seeded {len(users)} users.")
-    return users
+    fake.unique.clear()
+    print(f"Generated {len(rows)} users.")
+    return writer.submit(insert_returning_ids, User, rows)
 
 
-def seed_categories(session: Session):
-    """Seeds the database with fake categories."""
-    categories = []
+def seed_categories(writer: SeedWriter) -> Future[list[Row]]:
+    """Seeds the database with fake categories.
+
+    Returns:
+        A future resolving to the inserted categories' ids.
+    """
+    rows = []
     for _ in range(NUM_CATEGORIES):
-        category = Category(
-            category_name=fake.unique.word().capitalize() + " Books",
-            category_desc=fake.sentence(),
-            created_at=fake.date_time_this_decade(),
-            updated_at=datetime.now(),
+        rows.append(
+            {
+                "category_name": fake.unique.word().capitalize() + " Books",
+                "category_desc": fake.sentence(),
+                "created_at": fake.date_time_this_decade(),
+            }
         )
-        categories.append(category)
-    session.add_all(categories)
-    session.commit()
-    print(f"Seeded {len(categories)} categories.")
-    return categories
+    fake.unique.clear()
+    print(f"Generated {len(rows)} categories.")
+    return writer.submit(insert_returning_ids, Category, rows)
+
 
+def seed_authors(writer: SeedWriter) -> Future[list[Row]]:
+    """Seeds the database with fake authors.
 
-def seed_authors(session: Session):
-    """Seeds the database with fake authors."""
-    authors = []
+    Returns:
+        A future resolving to the inserted authors' ids.
+    """
+    rows = []
     for _ in range(NUM_AUTHORS):
-        author = Author(
-            author_name=fake.unique.name(),
-            author_bio=fake.paragraph(),
-            created_at=fake.date_time_this_decade(),
-            updated_at=datetime.now(),
+        rows.append(
+            {
+                "author_name": fake.unique.name(),
+                "author_bio": fake.paragraph(),
+                "created_at": fake.date_time_this_decade(),
+            }
         )
-        authors.append(author)
-    session.add_all(authors)
-    session.commit()
-    print(f"Seeded {len(authors)} authors.")
-    return authors
-
-
-def seed_books(session: Session, authors: list[Author], categories: list[Category]):
-    """Seeds the database with fake books."""
-    books = []
-    for _ in range(NUM_BOOKS):
-        book = Book(
-            book_title=fake.catch_phrase(),
-            book_summary=fake.text(max_nb_chars=500),
-            book_price=Decimal(random.uniform(9.99, 99.99)).quantize(Decimal("0.01")),
-            book_cover_photo=fake.image_url(),
-            category_id=random.choice(categories).id,
-            author_id=random.choice(authors).id,
-            created_at=fake.date_time_this_year(),
-            updated_at=datetime.now(),
+    fake.unique.clear()
+    print(f"Generated {len(rows)} authors.")
+    return writer.submit(insert_returning_ids, Author, rows)
+
+
+def seed_books(
+    writer: SeedWriter, authors: list[Row], categories: list[Row]
+) -> list[dict]:
+    """Seeds the database with fake books.
+
+    Returns:
+        The book rows queued for insertion, including their ids.
+    """
+    book_ids = writer.submit(reserve_ids, Book.__tablename__, NUM_BOOKS)
+    titles = text_pool(fake.catch_phrase)
+    summaries = text_pool(lambda: fake.text(max_nb_chars=500))
+    rows = []
+    for book_id in book_ids.result():
+        rows.append(
+            {
+                "id": book_id,
+                "book_title": random.choice(titles),
+                "book_summary": random.choice(summaries),
+                "book_price": Decimal(random.uniform(9.99, 99.99)).quantize(
+                    Decimal("0.01")
+                ),
+                "book_cover_photo": fake.image_url(),
+                "category_id": random.choice(categories).id,
+                "author_id": random.choice(authors).id,
+                "created_at": fake.date_time_this_year(),
+            }
         )
-        books.append(book)
-    session.add_all(books)
-    session.commit()
-    print(f"Seeded {len(books)} books.")
-    return books
-
-
-def seed_reviews(session: Session, users: list[User], books: list[Book]):
-    """Seeds the database with fake reviews."""
-    reviews = []
-    reviewed_pairs = set()  # Ensure a user reviews a book only once
-
-    for book in books:
-        num_reviews = random.randint(0, NUM_REVIEWS_PER_BOOK)
-        available_users = users[:]
-        random.shuffle(available_users)
-
-        for i in range(min(num_reviews, len(available_users))):
-            user = available_users[i]
-            if (user.id, book.id) not in reviewed_pairs:
-                review = Review(
-                    book_id=book.id,
-                    user_id=user.id,
-                    rating=random.randint(1, 5),
-                    review_title=fake.sentence(nb_words=5),
-                    review_details=fake.paragraph(nb_sentences=3),
-                    review_date=fake.date_time_between(start_date=book.created_at),
-                    created_at=fake.date_time_this_year(),
-                    updated_at=datetime.now(),
-                )
-                reviews.append(review)
-                reviewed_pairs.add((user.id, book.id))
-
-    session.add_all(reviews)
-    session.commit()
-    print(f"Seeded {len(reviews)} reviews.")
-    return reviews
-
-
-def seed_discounts(session: Session, books: list[Book]):
-    """Seeds the database with fake discounts."""
-    discounts = []
+    writer.submit(copy_rows, Book.__tablename__, rows)
+    print(f"Generated {len(rows)} books.")
+    return rows
+
+
+def seed_reviews(writer: SeedWriter, books: list[dict]) -> int:
+    """Seeds the database with fake reviews.
+
+    Returns:
+        The number of reviews queued for insertion.
+    """
+    titles = text_pool(lambda: fake.sentence(nb_words=5))
+    details = text_pool(lambda: fake.paragraph(nb_sentences=3))
+
+    # Draw every book's review count and all per-review values in bulk
+    review_counts = random.choices(range(NUM_REVIEWS_PER_BOOK + 1), k=len(books))
+    num_reviews = sum(review_counts)
+    ratings = iter(random.choices(range(1, 6), k=num_reviews))
+    review_titles = iter(random.choices(titles, k=num_reviews))
+    review_details = iter(random.choices(details, k=num_reviews))
+
+    rows = []
+    for book, count in zip(books, review_counts):
+        for _ in range(count):
+            rows.append(
+                {
+                    "book_id": book["id"],
+                    "rating": next(ratings),
+                    "review_title": next(review_titles),
+                    "review_details": next(review_details),
+                    "review_date": fake.date_time_between(
+                        start_date=book["created_at"]
+                    ),
+                    "created_at": fake.date_time_this_year(),
+                }
+            )
+
+    writer.submit(copy_rows, Review.__tablename__, rows)
+    print(f"Generated {len(rows)} reviews.")
+    return len(rows)
+
+
+def seed_discounts(writer: SeedWriter, books: list[dict]) -> int:
+    """Seeds the database with fake discounts.
+
+    Returns:
+        The number of discounts queued for insertion.
+    """
+    rows = []
     discounted_books = random.sample(books, min(NUM_DISCOUNTS, len(books)))
 
     for book in discounted_books:
-        discount_price = (book.book_price * Decimal(random.uniform(0.5, 0.9))).quantize(
-            Decimal("0.01")
-        )
+        discount_price = (
+            book["book_price"] * Decimal(random.uniform(0.5, 0.9))
+        ).quantize(Decimal("0.01"))
         start_date = fake.date_between(start_date="-1y", end_date="+1y")
         end_date = fake.date_between(
             start_date=start_date,
@@ -191,113 +386,162 @@ def seed_discounts(session: Session, books: list[Book]):
         if start_date and end_date and start_date > end_date:
             start_date, end_date = end_date, start_date
 
-        discount = Discount(
-            book_id=book.id,
-            discount_price=discount_price,
-            discount_start_date=start_date,
-            discount_end_date=end_date,
-            created_at=fake.date_time_this_year(),
-            updated_at=datetime.now(),
+        rows.append(
+            {
+                "book_id": book["id"],
+                "discount_price": discount_price,
+                "discount_start_date": start_date,
+                "discount_end_date": end_date,
+                "created_at": fake.date_time_this_year(),
+            }
         )
-        discounts.append(discount)
 
-    session.add_all(discounts)
-    session.commit()
-    print(f"Seeded {len(discounts)} discounts.")
-    return discounts
-
-
-def seed_orders(session: Session, users: list[User], books: list[Book]):
-    """Seeds the database with fake orders and order items."""
-    orders_to_create = []
-    all_items_to_create = []
-
-    for _ in range(NUM_ORDERS):
+    if rows:
+        writer.submit(Session.execute, insert(Discount), rows)
+    print(f"Generated {len(rows)} discounts.")
+    return len(rows)
+
+
+# Inserts orders and their items in one round-trip. Order ids are drawn from
+# the sequence inside the first CTE so items can be matched to their order by
+# row number; the foreign key is checked once the whole statement finishes.
+INSERT_ORDERS_WITH_ITEMS = text(
+    """
+    WITH new_order AS (
+        SELECT nextval(pg_get_serial_sequence('order', 'id')) AS id, o.*
+        FROM unnest(
+            CAST(:user_ids AS bigint[]),
+            CAST(:order_dates AS timestamp[]),
+            CAST(:order_amounts AS numeric[])
+        ) WITH ORDINALITY AS o(user_id, order_date, order_amount, rn)
+    ), inserted_order AS (
+        INSERT INTO "order" (
+            id, user_id, order_date, order_amount, created_at, updated_at
+        )
+        SELECT id, user_id, order_date, order_amount, order_date, order_date
+        FROM new_order
+    )
+    INSERT INTO order_item (
+        order_id, book_id, quantity, price, created_at, updated_at
+    )
+    SELECT new_order.id, i.book_id, i.quantity, i.price,
+           new_order.order_date, new_order.order_date
+    FROM unnest(
+        CAST(:item_order_rns AS bigint[]),
+        CAST(:item_book_ids AS bigint[]),
+        CAST(:item_quantities AS integer[]),
+        CAST(:item_prices AS numeric[])
+    ) AS i(rn, book_id, quantity, price)
+    JOIN new_order ON new_order.rn = i.rn
+    """
+)
+
+
+def seed_orders(
+    writer: SeedWriter, users: list[Row], books: list[dict]
+) -> tuple[int, int]:
+    """Seeds the database with fake orders and order items.
+
+    Returns:
+        The number of orders and the number of order items queued for insertion.
+    """
+    orders = {"user_ids": [], "order_dates": [], "order_amounts": []}
+    items = {
+        "item_order_rns": [],
+        "item_book_ids": [],
+        "item_quantities": [],
+        "item_prices": [],
+    }
+
+    for rn in range(1, NUM_ORDERS + 1):
         user = random.choice(users)
         num_items = random.randint(1, MAX_ITEMS_PER_ORDER)
         order_books = random.sample(books, min(num_items, len(books)))
         order_date = fake.date_time_this_year()
 
-        current_order_items = []
         total_amount = Decimal("0.00")
 
         for book in order_books:
             quantity = random.randint(1, 3)
             # Simplified price logic for seeding - just use book price
             # In a real scenario, check for active discounts here
-            price = book.book_price
+            price = book["book_price"]
             item_total = price * Decimal(quantity)
             total_amount += item_total
 
-            order_item = OrderItem(
-                # order_id will be set later
-                book_id=book.id,
-                quantity=quantity,
-                price=price,
-                created_at=order_date,
-                updated_at=order_date,
-            )
-            current_order_items.append(order_item)
-
-        order = Order(
-            user_id=user.id,
-            order_date=order_date,
-            order_amount=total_amount,
-            created_at=order_date,
-            updated_at=order_date,
-        )
-        # Store order and its items together temporarily
-        orders_to_create.append((order, current_order_items))
-
-    # Add orders first
-    session.add_all([order for order, items in orders_to_create])
-    session.flush()  # Flush to get order IDs
-
-    # Now link items to orders and prepare them for adding
-    for order, items in orders_to_create:
-        for item in items:
-            item.order_id = order.id  # Set the obtained order ID
-            all_items_to_create.append(item)
-
-    # Add all items
-    session.add_all(all_items_to_create)
-    session.commit()
-    print(
-        f"Seeded {len(orders_to_create)} orders and {len(all_items_to_create)} order items."
-    )
-    # Return only orders as items are implicitly linked
-    return [order for order, items in orders_to_create], all_items_to_create
+            items["item_order_rns"].append(rn)
+            items["item_book_ids"].append(book["id"])
+            items["item_quantities"].append(quantity)
+            items["item_prices"].append(price)
+
+        orders["user_ids"].append(user.id)
+        orders["order_dates"].append(order_date)
+        orders["order_amounts"].append(total_amount)
+
+    writer.submit(Session.execute, INSERT_ORDERS_WITH_ITEMS, {**orders, **items})
+    num_orders = len(orders["user_ids"])
+    num_items = len(items["item_book_ids"])
+    print(f"Generated {num_orders} orders and {num_items} order items.")
+    return num_orders, num_items
 
 
 def seed_all():
-    """Runs all seeding functions."""
+    """Runs all seeding functions in a single transaction."""
     print("Starting database seeding...")
     # create_db_and_tables()  # Ensure tables exist
 
     with Session(engine) as session:
-        # Clear existing data first
-        clear_data(session)
+        writer = SeedWriter(session)
+        try:
+            # One commit at the end, and it does not wait for the WAL flush
+            session.execute(text("SET LOCAL synchronous_commit = off"))
+
+            # Clear existing data first
+            clear_data(session)
+
+            print("Dropping indexes and foreign keys...")
+            restore_statements = drop_indexes_and_foreign_keys(session)
+
+            # From here on the writer owns the session until wait() returns;
+            # each table is generated while the previous one is written
+            print("Seeding users...")
+            users = seed_users(writer)
+
+            print("Seeding categories...")
+            categories = seed_categories(writer)
+
+            print("Seeding authors...")
+            authors = seed_authors(writer)
+
+            print("Seeding books...")
+            books = seed_books(writer, authors.result(), categories.result())
 
-        print("Seeding users...")
-        users = seed_users(session)
+            print("Seeding reviews...")
+            seed_reviews(writer, books)
 
-        print("Seeding categories...")
-        categories = seed_categories(session)
+            print("Seeding discounts...")
+            seed_discounts(writer, books)
 
-        print("Seeding authors...")
-        authors = seed_authors(session)
+            print("Seeding orders...")
+            seed_orders(writer, users.result(), books)
 
-        print("Seeding books...")
-        books = seed_books(session, authors, categories)
+            print("Waiting for pending writes...")
+            writer.wait()
+            writer.shutdown()
 
-        print("Seeding reviews...")
-        seed_reviews(session, users, books)
+            print("Recreating indexes and foreign keys...")
+            restore_indexes_and_foreign_keys(session, restore_statements)
 
-        print("Seeding discounts...")
-        seed_discounts(session, books)
+            print("Refreshing materialized views...")
+            session.execute(text("REFRESH MATERIALIZED VIEW top_discounted_book"))
+            session.execute(text("REFRESH MATERIALIZED VIEW book_rating"))
 
-        print("Seeding orders...")
-        seed_orders(session, users, books)
+            session.commit()
+        except Exception:
+            writer.shutdown()
+            # DDL is transactional, so this also restores dropped indexes
+            session.rollback()
+            raise
 
     print("Database seeding completed.")
 
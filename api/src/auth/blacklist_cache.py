@@ -0,0 +1,76 @@
+import time
+from datetime import datetime, timezone
+from threading import Lock
+
+from sqlmodel import Session, select
+
+from src.auth.models import BlacklistedToken
+
+BLACKLIST_REFRESH_SECONDS = 10
+
+
+class BlacklistCache:
+    """In-memory snapshot of the tokens that are blacklisted and not yet expired.
+
+    Lookups are set membership tests. The snapshot is reloaded from the
+    database once it is older than the refresh interval, so tokens revoked by
+    other workers are picked up within that window; tokens revoked by this
+    process are added immediately.
+
+    Attributes:
+        refresh_interval: The maximum age of the snapshot in seconds.
+    """
+
+    def __init__(self, refresh_interval: float):
+        """Initializes BlacklistCache.
+
+        Args:
+            refresh_interval: The maximum age of the snapshot in seconds.
+        """
+        self.refresh_interval = refresh_interval
+        self._tokens: frozenset[str] = frozenset()
+        self._loaded_at = float("-inf")
+        self._lock = Lock()
+
+    def contains(self, session: Session, token: str) -> bool:
+        """Checks whether a token is blacklisted, reloading a stale snapshot first.
+
+        Args:
+            session: The database session used if the snapshot must be reloaded.
+            token: The token to check.
+
+        Returns:
+            True if the token is blacklisted, False otherwise.
+        """
+        if time.monotonic() - self._loaded_at >= self.refresh_interval:
+            with self._lock:
+                # Another thread may have reloaded while we waited for the lock
+                if time.monotonic() - self._loaded_at >= self.refresh_interval:
+                    self.refresh(session)
+        return token in self._tokens
+
+    def refresh(self, session: Session) -> None:
+        """Reloads the snapshot of unexpired blacklisted tokens.
+
+        Args:
+            session: The database session.
+        """
+        now = datetime.now(timezone.utc)
+        tokens = session.exec(
+            select(BlacklistedToken.token).where(BlacklistedToken.expiry > now)
+        ).all()
+        self._tokens = frozenset(tokens)
+        self._loaded_at = time.monotonic()
+
+    def add(self, token: str) -> None:
+        """Adds a newly blacklisted token to the snapshot.
+
+        Args:
+            token: The token that was blacklisted.
+        """
+        with self._lock:
+            self._tokens = self._tokens | {token}
+
+
+blacklist_cache = BlacklistCache(refresh_interval=BLACKLIST_REFRESH_SECONDS)
+"""Process-wide blacklist snapshot used on every authenticated request."""
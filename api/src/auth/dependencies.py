@@ -1,22 +1,39 @@
-from fastapi import Depends
+import time
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlmodel import Session, select
+from jwt.exceptions import InvalidTokenError
+from sqlmodel import Session
 
 from src.auth.exceptions import InvalidCredentialsError
 from src.auth.models import TokenPayload, User
-from src.auth.service import is_token_blacklisted, purge_expired_blacklisted_tokens
-from src.config import settings
+from src.auth.service import decode_token, get_user_by_subject
+from src.cache import TTLCache
 from src.database import get_session
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
+USER_CACHE_MAXSIZE = 10_000
+USER_CACHE_TTL_SECONDS = 30
+
+_user_cache: TTLCache[str, User] = TTLCache(
+    maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL_SECONDS
+)
+"""Detached users keyed by the raw bearer token that authenticated them."""
+
 
 def get_current_user(
     token: str = Depends(oauth2_scheme), session: Session = Depends(get_session)
 ) -> User:
     """Decodes the JWT token and retrieves the current user.
 
+    Access tokens are short-lived and are not checked against the blacklist;
+    logging out revokes the refresh token instead, so no database query is
+    needed to accept a valid access token. Users are cached by token for a
+    short TTL, never past the token's expiry, so repeated requests also skip
+    JWT decoding and the user lookup.
+
     Args:
         token: The OAuth2 bearer token extracted from the request header.
         session: The database session dependency.
@@ -25,37 +42,62 @@ def get_current_user(
         The authenticated User object.
 
     Raises:
-        InvalidCredentialsError: If the token is invalid, expired, blacklisted or the user
-                                 associated with the token does not exist.
+        InvalidCredentialsError: If the token is invalid, expired, a refresh token or
+                                 the user associated with the token does not exist.
     """
     credentials_exception = InvalidCredentialsError("Could not validate credentials")
 
-    # Check if the token is blacklisted
-    if is_token_blacklisted(session, token):
-        raise InvalidCredentialsError("Token has been revoked")
-
-    # Occasionally clean up expired tokens from blacklist
-    # Placeholder as prototype for actual implementation
-    import random
-
-    if random.random() < 0.01:  # 1% chance
-        purge_expired_blacklisted_tokens(session)
+    cached_user = _user_cache.get(token)
+    if cached_user is not None:
+        return cached_user
 
     try:
-        payload_data = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload_data = decode_token(token)
         payload = TokenPayload.model_validate(payload_data)
-        email: str | None = payload.sub
-        if email is None:
+        subject: str | None = payload.sub
+        # Refresh tokens are only accepted by the refresh endpoint
+        if subject is None or payload_data.get("token_type") == "refresh":
             raise credentials_exception
-    except JWTError:
+    except InvalidTokenError:
         raise credentials_exception
 
-    statement = select(User).where(User.email == email)
-    user = session.exec(statement).first()
+    user = get_user_by_subject(session, subject)
 
     if user is None:
         raise credentials_exception
 
+    # Cache a detached copy so later sessions committing do not expire it
+    _user_cache.set(
+        token,
+        User.model_validate(user),
+        ttl=min(USER_CACHE_TTL_SECONDS, payload_data.get("exp", 0) - time.time()),
+    )
     return user
+
+
+CurrentUser = Annotated[User, Depends(get_current_user)]
+"""The authenticated user, resolved once per request."""
+
+
+def require_admin(current_user: CurrentUser) -> User:
+    """Resolves the current user, rejecting anyone who is not an admin.
+
+    Args:
+        current_user: The authenticated user dependency.
+
+    Returns:
+        The authenticated admin user.
+
+    Raises:
+        HTTPException: If the user is not an admin.
+    """
+    if not current_user.admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+        )
+    return current_user
+
+
+AdminUser = Annotated[User, Depends(require_admin)]
+"""The authenticated user, who must be an admin."""
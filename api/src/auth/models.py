@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 from pydantic import EmailStr
-from sqlalchemy import BigInteger
+from sqlalchemy import BigInteger, Index
 from sqlmodel import Field, SQLModel
 
 from src.models import TimestampModel
@@ -77,7 +77,11 @@ class BlacklistedToken(TimestampModel, table=True):
         blacklisted_on: The time when the token was blacklisted.
     """
 
+    # Leading on expiry serves both the purge and the blacklist snapshot
+    # (unexpired tokens), and including token makes the snapshot index-only
+    __table_args__ = (Index("ix_blacklistedtoken_expiry_token", "expiry", "token"),)
+
     id: Optional[int] = Field(sa_type=BigInteger, default=None, primary_key=True)
-    token: str = Field(index=True)
+    token: str = Field(index=True, unique=True)
     expiry: datetime
     blacklisted_on: datetime = Field(default_factory=datetime.now)
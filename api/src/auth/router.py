@@ -1,18 +1,18 @@
 from datetime import timedelta
 from typing import Any
 
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, Header
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import jwt, JWTError
+from jwt.exceptions import InvalidTokenError
 from sqlmodel import Session
 
 from src.auth.exceptions import InvalidCredentialsError
-from src.auth.dependencies import get_current_user, oauth2_scheme
+from src.auth.dependencies import CurrentUser, oauth2_scheme
 from src.auth.models import (
     RefreshTokenRequest,
     Token,
     TokenPayload,
-    User,
     UserCreate,
     UserRegister,
     UserResponse,
@@ -23,17 +23,21 @@ from src.auth.service import (
     create_access_token,
     create_refresh_token,
     create_user,
+    decode_token,
     get_user_by_email,
+    get_user_by_subject,
+    is_token_blacklisted,
 )
 from src.config import settings
 from src.database import get_session
+from src.exceptions import BadRequestError
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 """Authentication related routes."""
 
 
 @router.post("/signup", response_model=UserResponse)
-def register_user(
+async def register_user(
     user_in: UserRegister, session: Session = Depends(get_session)
 ) -> Any:
     """Registers a new user.
@@ -48,19 +52,19 @@ def register_user(
     Raises:
         HTTPException: If a user with the same email already exists.
     """
-    user = get_user_by_email(session=session, email=user_in.email)
+    user = await anyio.to_thread.run_sync(get_user_by_email, session, user_in.email)
     if user:
         raise HTTPException(
             status_code=400,
             detail="The user with this email already exists in the system",
         )
     user_create = UserCreate.model_validate(user_in)
-    user = create_user(session=session, user_create=user_create)
+    user = await create_user(session=session, user_create=user_create)
     return user
 
 
 @router.post("/token", response_model=Token)
-def login_for_access_token(
+async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     session: Session = Depends(get_session),
 ):
@@ -75,14 +79,14 @@ def login_for_access_token(
     Returns:
         A dictionary containing the access token and token type.
     """
-    user = authenticate_user(session, form_data.username, form_data.password)
+    user_id = await authenticate_user(session, form_data.username, form_data.password)
 
     access_token = create_access_token(
-        data={"sub": user.email},
+        data={"sub": str(user_id)},
         expires_delta=timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES),
     )
     refresh_token = create_refresh_token(
-        data={"sub": user.email},
+        data={"sub": str(user_id)},
         expires_delta=timedelta(minutes=settings.JWT_REFRESH_TOKEN_EXPIRE_MINUTES),
     )
 
@@ -93,25 +97,32 @@ def login_for_access_token(
     }
 
 
-@router.post("/logout", status_code=200)
+@router.post("/logout", status_code=200, dependencies=[Depends(oauth2_scheme)])
 def logout(
     session: Session = Depends(get_session),
-    token: str = Depends(oauth2_scheme),
     refresh_token: str = Header(None),
 ):
-    """Logs out the current user by blacklisting their active tokens.
+    """Logs out the current user by blacklisting their refresh token.
+
+    Access tokens are short-lived and not checked against the blacklist, so
+    revoking the refresh token is what ends the session: no new access tokens
+    can be obtained once the current one expires.
 
     Args:
         session: The database session dependency.
-        token: The current access token to blacklist.
-        refresh_token: Optional refresh token to also blacklist.
+        refresh_token: The refresh token to blacklist, sent in the
+                       `refresh-token` header.
 
     Returns:
         A success message.
+
+    Raises:
+        BadRequestError: If no refresh token is sent.
     """
-    blacklist_token(session, token)
-    if refresh_token:
-        blacklist_token(session, refresh_token)
+    if not refresh_token:
+        # Without it nothing would be revoked, so don't report a logout
+        raise BadRequestError("Missing refresh token")
+    blacklist_token(session, refresh_token)
 
     return {"message": "Successfully logged out"}
 
@@ -123,33 +134,43 @@ def refresh_token(
 ):
     """Refreshes the access token using a refresh token.
 
+    The refresh token is rotated: a new one is issued alongside the access
+    token and the one presented is blacklisted, so each refresh token can
+    only be used once.
+
     Args:
-        token: The refresh token.
+        request: The request body containing the refresh token.
         session: The database session dependency.
 
     Returns:
-        A dictionary containing the new access token and token type.
+        A dictionary containing the new access and refresh tokens and the
+        token type.
     """
-    refresh_token = request.refresh_token
+    old_refresh_token = request.refresh_token
+    if is_token_blacklisted(session, old_refresh_token):
+        raise InvalidCredentialsError("Refresh token has been revoked")
     try:
-        payload_data = jwt.decode(
-            refresh_token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload_data = decode_token(old_refresh_token)
         payload = TokenPayload.model_validate(payload_data)
-        email: str | None = payload.sub
-        if email is None:
+        subject: str | None = payload.sub
+        if subject is None or payload_data.get("token_type") != "refresh":
             raise InvalidCredentialsError("Invalid refresh token")
-    except JWTError:
+    except InvalidTokenError:
         raise InvalidCredentialsError("Invalid refresh token")
-    user = get_user_by_email(session=session, email=email)
+    user = get_user_by_subject(session=session, subject=subject)
     if user is None:
         raise InvalidCredentialsError("Invalid refresh token")
+    # Only the request that actually revokes the old token may rotate it
+    if not blacklist_token(session, old_refresh_token):
+        raise InvalidCredentialsError("Refresh token has been revoked")
     access_token = create_access_token(
-        data={"sub": user.email},
+        data={"sub": str(user.id)},
         expires_delta=timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES),
     )
-
-    # New refresh token can be created here if needed
+    refresh_token = create_refresh_token(
+        data={"sub": str(user.id)},
+        expires_delta=timedelta(minutes=settings.JWT_REFRESH_TOKEN_EXPIRE_MINUTES),
+    )
 
     return {
         "access_token": access_token,
@@ -159,7 +180,7 @@ def refresh_token(
 
 
 @router.get("/me", response_model=UserResponse)
-def read_current_user(current_user: User = Depends(get_current_user)):
+def read_current_user(current_user: CurrentUser):
     """Gets the information of the currently authenticated user.
 
     Args:
@@ -1,20 +1,85 @@
+import os
+import secrets
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
-from uuid import uuid4
 
-from jose import jwt
+import anyio
 import bcrypt
+from jwt.exceptions import ExpiredSignatureError
+from sqlalchemy import Row, bindparam, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel import Session, select
 
+from src.auth.blacklist_cache import blacklist_cache
 from src.auth.models import BlacklistedToken
 from src.auth.exceptions import InvalidCredentialsError, UserAlreadyExistsError
 from src.auth.models import User, UserCreate
+from src.auth.tokens import build_jwt_codec
 from src.config import settings
 
-# No need for CryptContext, bcrypt will be used directly
-
 ALGORITHM = "HS256"
 
+JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+_jwt = build_jwt_codec(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+
+# Statements on the login and logout paths are built once and bound per call
+_BLACKLIST_TOKEN_STMT = (
+    pg_insert(BlacklistedToken)
+    .values(
+        token=bindparam("token"),
+        expiry=bindparam("expiry"),
+        blacklisted_on=bindparam("blacklisted_on"),
+    )
+    .on_conflict_do_nothing(index_elements=[BlacklistedToken.token])
+    .returning(BlacklistedToken.id)
+)
+_USER_CREDENTIALS_BY_EMAIL_STMT = select(User.id, User.hashed_password).where(
+    User.email == bindparam("email")
+)
+_USER_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
+
+# bcrypt is CPU-bound; more concurrent hashes than cores only queue up while
+# holding threads from the shared pool that other requests need
+_bcrypt_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+
+# Checked against when the email is unknown, so every login costs one bcrypt
+# verification and response times do not reveal which emails are registered
+_DUMMY_PASSWORD_HASH = bcrypt.hashpw(
+    b"dummy-password", bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+).decode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def _decode_token_cached(token: str) -> dict:
+    """Verifies and decodes a JWT; results are memoized per token string."""
+    return _jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=JWT_ALGORITHMS)
+
+
+def decode_token(token: str) -> dict:
+    """Decodes and verifies a JWT, reusing the result for tokens seen before.
+
+    Tokens are immutable, so the signature check only has to run once per
+    token. The expiry is re-checked on every call because a cached payload
+    may have expired since it was first decoded.
+
+    Args:
+        token: The encoded JWT.
+
+    Returns:
+        A copy of the token's payload.
+
+    Raises:
+        InvalidTokenError: If the token is malformed, has an invalid signature or has expired.
+    """
+    payload = _decode_token_cached(token)
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        raise ExpiredSignatureError("Signature has expired.")
+    return dict(payload)
+
 
 def create_access_token(data: dict, expires_delta: timedelta) -> str:
     """Creates a JWT access token.
@@ -27,8 +92,8 @@ def create_access_token(data: dict, expires_delta: timedelta) -> str:
         The encoded JWT access token string.
     """
     expire = datetime.now(timezone.utc) + expires_delta
-    to_encode = {"exp": expire, "jti": str(uuid4()), **data}
-    encoded_jwt = jwt.encode(
+    to_encode = {"exp": expire, "jti": secrets.token_urlsafe(16), **data}
+    encoded_jwt = _jwt.encode(
         to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
     )
     return encoded_jwt
@@ -45,46 +110,60 @@ def create_refresh_token(data: dict, expires_delta: timedelta) -> str:
         The encoded JWT refresh token string.
     """
     expire = datetime.now(timezone.utc) + expires_delta
-    to_encode = {"exp": expire, "token_type": "refresh", "jti": str(uuid4()), **data}
-    encoded_jwt = jwt.encode(
+    to_encode = {
+        "exp": expire,
+        "token_type": "refresh",
+        "jti": secrets.token_urlsafe(16),
+        **data,
+    }
+    encoded_jwt = _jwt.encode(
         to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
     )
     return encoded_jwt
 
 
-def blacklist_token(session: Session, token: str) -> None:
+def blacklist_token(session: Session, token: str) -> bool:
     """Blacklists a token so it can no longer be used for authentication.
 
+    The row is written with a single INSERT ... ON CONFLICT DO NOTHING, so
+    there is no separate existence check and concurrent requests cannot both
+    succeed.
+
     Args:
         session: The database session.
         token: The token to blacklist.
+
+    Returns:
+        True if this call blacklisted the token, False if it was already
+        blacklisted (including by a concurrent request) or is invalid.
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_token(token)
         expiry = datetime.fromtimestamp(payload.get("exp"), tz=timezone.utc)
 
-        # Check if already blacklisted
-        existing = session.exec(
-            select(BlacklistedToken).where(BlacklistedToken.token == token)
+        inserted = session.execute(
+            _BLACKLIST_TOKEN_STMT,
+            {
+                "token": token,
+                "expiry": expiry,
+                "blacklisted_on": datetime.now(timezone.utc),
+            },
         ).first()
-
-        if existing:
-            return  # Already blacklisted
-
-        token_entry = BlacklistedToken(
-            token=token, expiry=expiry, blacklisted_on=datetime.now(timezone.utc)
-        )
-        session.add(token_entry)
         session.commit()
     except Exception:
-        pass
+        session.rollback()
+        return False
+
+    blacklist_cache.add(token)
+    return inserted is not None
 
 
 def is_token_blacklisted(session: Session, token: str) -> bool:
     """Checks if a token is blacklisted.
 
+    Answers from the in-memory blacklist snapshot, which only queries the
+    database when it needs refreshing.
+
     Args:
         session: The database session.
         token: The token to check.
@@ -92,10 +171,7 @@ def is_token_blacklisted(session: Session, token: str) -> bool:
     Returns:
         True if the token is blacklisted, False otherwise.
     """
-    blacklisted = session.exec(
-        select(BlacklistedToken).where(BlacklistedToken.token == token)
-    ).first()
-    return blacklisted is not None
+    return blacklist_cache.contains(session, token)
 
 
 def purge_expired_blacklisted_tokens(session: Session) -> int:
@@ -108,19 +184,9 @@ def purge_expired_blacklisted_tokens(session: Session) -> int:
         The number of tokens removed.
     """
     now = datetime.now(timezone.utc)
-    expired_tokens = session.exec(
-        select(BlacklistedToken).where(BlacklistedToken.expiry < now)
-    ).all()
-
-    count = 0
-    for token in expired_tokens:
-        session.delete(token)
-        count += 1
-
-    if count > 0:
-        session.commit()
-
-    return count
+    result = session.exec(delete(BlacklistedToken).where(BlacklistedToken.expiry < now))
+    session.commit()
+    return result.rowcount
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -147,13 +213,15 @@ def get_password_hash(password: str) -> str:
     Returns:
         The hashed password string.
     """
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
-def create_user(user_create: UserCreate, session: Session) -> User:
+async def create_user(user_create: UserCreate, session: Session) -> User:
     """Creates a new user in the database.
 
-    Checks if a user with the given email already exists.
+    Checks if a user with the given email already exists. Database calls and
+    password hashing run in worker threads so the event loop is not blocked.
 
     Args:
         user_create: The user data for creation.
@@ -165,42 +233,77 @@ def create_user(user_create: UserCreate, session: Session) -> User:
     Raises:
         UserAlreadyExistsError: If a user with the same email already exists.
     """
-    existing_user = get_user_by_email(session, user_create.email)
+    existing_user = await anyio.to_thread.run_sync(
+        get_user_by_email, session, user_create.email
+    )
     if existing_user:
         raise UserAlreadyExistsError()
 
-    user = User.model_validate(
-        user_create, update={"hashed_password": get_password_hash(user_create.password)}
+    hashed_password = await anyio.to_thread.run_sync(
+        get_password_hash, user_create.password, limiter=_bcrypt_limiter
     )
+    user = User(
+        first_name=user_create.first_name,
+        last_name=user_create.last_name,
+        email=user_create.email,
+        admin=user_create.admin,
+        hashed_password=hashed_password,
+    )
+    await anyio.to_thread.run_sync(_save_user, session, user)
+    return user
+
+
+def _save_user(session: Session, user: User) -> None:
+    """Inserts a user and refreshes it with its database-generated fields."""
     session.add(user)
     session.commit()
     session.refresh(user)
-    return user
 
 
-def authenticate_user(session: Session, email: str, password: str) -> User:
+async def authenticate_user(session: Session, email: str, password: str) -> int:
     """Authenticates a user by email and password.
 
+    Only the columns needed to check the password are loaded. The lookup and
+    the password check run in worker threads so the event loop is not blocked.
+
     Args:
         session: The database session.
         email: The user's email.
         password: The user's plain text password.
 
     Returns:
-        The authenticated user object.
+        The ID of the authenticated user.
 
     Raises:
         InvalidCredentialsError: If authentication fails (user not found or password mismatch).
     """
-    user = get_user_by_email(session, email)
+    credentials = await anyio.to_thread.run_sync(get_user_credentials, session, email)
+    hashed_password = (
+        credentials.hashed_password if credentials else _DUMMY_PASSWORD_HASH
+    )
 
-    if not user:
+    password_matches = await anyio.to_thread.run_sync(
+        verify_password, password, hashed_password, limiter=_bcrypt_limiter
+    )
+    if not credentials or not password_matches:
         raise InvalidCredentialsError()
 
-    if not verify_password(password, user.hashed_password):
-        raise InvalidCredentialsError()
+    return credentials.id
 
-    return user
+
+def get_user_credentials(session: Session, email: str) -> Optional[Row]:
+    """Retrieves the ID and password hash of a user by email.
+
+    Args:
+        session: The database session.
+        email: The email of the user to retrieve.
+
+    Returns:
+        A row with `id` and `hashed_password` if found, otherwise None.
+    """
+    return session.exec(
+        _USER_CREDENTIALS_BY_EMAIL_STMT, params={"email": email}
+    ).first()
 
 
 def get_user_by_email(session: Session, email: str) -> Optional[User]:
@@ -213,5 +316,24 @@ def get_user_by_email(session: Session, email: str) -> Optional[User]:
     Returns:
         The User object if found, otherwise None.
     """
-    statement = select(User).where(User.email == email)
-    return session.exec(statement).first()
+    return session.exec(_USER_BY_EMAIL_STMT, params={"email": email}).first()
+
+
+def get_user_by_subject(session: Session, subject: str) -> Optional[User]:
+    """Retrieves the user identified by a token's `sub` claim.
+
+    Tokens carry the user ID, which is looked up by primary key (and served
+    from the session's identity map when already loaded). Tokens issued
+    before the switch carry the email instead and fall back to an email
+    lookup until they expire.
+
+    Args:
+        session: The database session.
+        subject: The `sub` claim of the token.
+
+    Returns:
+        The User object if found, otherwise None.
+    """
+    if subject.isdigit():
+        return session.get(User, int(subject))
+    return get_user_by_email(session, subject)
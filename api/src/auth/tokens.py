@@ -0,0 +1,72 @@
+from jwt import PyJWT
+from jwt.algorithms import HMACAlgorithm
+
+
+class PreparedHMACAlgorithm(HMACAlgorithm):
+    """HMAC algorithm that validates and converts the signing secret only once.
+
+    PyJWT prepares the key on every encode and decode, which for HMAC means
+    ruling out PEM, SSH, DER and JWK inputs before using the secret. The
+    application always signs with the same secret, so that work is done at
+    construction and reused.
+
+    Attributes:
+        secret: The secret the prepared key was derived from.
+    """
+
+    def __init__(self, hash_alg, secret: str):
+        """Initializes PreparedHMACAlgorithm.
+
+        Args:
+            hash_alg: The hashlib constructor, e.g. `HMACAlgorithm.SHA256`.
+            secret: The signing secret.
+        """
+        super().__init__(hash_alg)
+        self.secret = secret
+        self._prepared_key = super().prepare_key(secret)
+
+    def prepare_key(self, key: str | bytes) -> bytes:
+        """Returns the cached key for the configured secret, else prepares `key`."""
+        if key == self.secret:
+            return self._prepared_key
+        return super().prepare_key(key)
+
+
+class PreparedKeyJWT(PyJWT):
+    """PyJWT instance whose HMAC algorithm reuses the prepared key for `secret`.
+
+    The JWS object built by `PyJWT.__init__` is kept, so its signature options
+    follow the options passed here; only the algorithm entry is swapped.
+    """
+
+    def __init__(self, secret: str, algorithm: str, options=None):
+        """Initializes PreparedKeyJWT.
+
+        Args:
+            secret: The signing secret.
+            algorithm: The JWT algorithm name, e.g. "HS256".
+            options: PyJWT decode options, as accepted by `PyJWT`.
+        """
+        super().__init__(options)
+        hash_alg = getattr(HMACAlgorithm, f"SHA{algorithm[2:]}", None)
+        if algorithm.startswith("HS") and hash_alg is not None:
+            self._jws.unregister_algorithm(algorithm)
+            self._jws.register_algorithm(
+                algorithm, PreparedHMACAlgorithm(hash_alg, secret)
+            )
+
+
+def build_jwt_codec(secret: str, algorithm: str) -> PyJWT:
+    """Builds a PyJWT instance that reuses the prepared key for `secret`.
+
+    Only HMAC algorithms (HS256/HS384/HS512) have their key cached; any other
+    algorithm falls back to PyJWT's default handling.
+
+    Args:
+        secret: The signing secret.
+        algorithm: The JWT algorithm name.
+
+    Returns:
+        A PyJWT instance with the same API as the `jwt` module functions.
+    """
+    return PreparedKeyJWT(secret, algorithm)
@@ -1,20 +1,20 @@
-from typing import Any, List
+from typing import Any, Iterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
-from src.auth.dependencies import get_current_user
-from src.auth.models import User
+from src.auth.dependencies import AdminUser
 from src.author.models import Author, AuthorCreate, AuthorResponse, AuthorUpdate
 from src.author.service import (
     create_author,
     delete_author,
-    get_all_authors,
-    get_author,
+    get_author_cached,
     get_authors,
+    stream_all_authors_json,
     update_author,
 )
-from src.database import get_session
+from src.database import engine, get_session
 from src.pagination import PageResponse, PaginationParams
 
 router = APIRouter(prefix="/authors", tags=["authors"])
@@ -24,8 +24,8 @@ router = APIRouter(prefix="/authors", tags=["authors"])
 @router.post("/", response_model=AuthorResponse, status_code=status.HTTP_201_CREATED)
 def create_author_endpoint(
     author_in: AuthorCreate,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Creates a new author.
 
@@ -33,8 +33,8 @@ def create_author_endpoint(
 
     Args:
         author_in: The author data for creation.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Returns:
         The created author.
@@ -42,43 +42,50 @@ def create_author_endpoint(
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     return create_author(session=session, author_create=author_in)
 
 
 @router.get("/all", response_model=List[AuthorResponse])
-def read_all_authors(session: Session = Depends(get_session)) -> Any:
+def read_all_authors() -> StreamingResponse:
     """Gets all authors.
 
-    Args:
-        session: The database session dependency.
+    The list is streamed as it is read from the database. The stream opens
+    its own session because request-scoped dependencies are closed before
+    the response body is sent.
 
     Returns:
-        A list of all authors.
+        A streaming JSON response with a list of all authors.
     """
-    return get_all_authors(session=session)
+
+    def stream() -> Iterator[bytes]:
+        with Session(engine) as session:
+            yield from stream_all_authors_json(session=session)
+
+    return StreamingResponse(stream(), media_type="application/json")
 
 
 @router.get("/", response_model=PageResponse[AuthorResponse])
 def read_authors(
     pagination: PaginationParams = Depends(),
+    cursor: Optional[str] = Query(
+        None, description="The next_cursor of the previous page"
+    ),
     session: Session = Depends(get_session),
 ) -> Any:
     """Gets a paginated list of authors.
 
+    Pass the `next_cursor` of a response as `cursor` to fetch the following
+    page without an offset.
+
     Args:
         pagination: The pagination parameters dependency.
+        cursor: Optional keyset pagination cursor.
         session: The database session dependency.
 
     Returns:
         A paginated response containing authors.
     """
-    return get_authors(session=session, pagination=pagination)
+    return get_authors(session=session, pagination=pagination, cursor=cursor)
 
 
 @router.get("/{author_id}", response_model=AuthorResponse)
@@ -95,15 +102,15 @@ def read_author(
     Returns:
         The requested author.
     """
-    return get_author(session=session, author_id=author_id)
+    return get_author_cached(session=session, author_id=author_id)
 
 
 @router.put("/{author_id}", response_model=AuthorResponse)
 def update_author_endpoint(
     author_id: int,
     author_in: AuthorUpdate,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Updates an author.
 
@@ -112,8 +119,8 @@ def update_author_endpoint(
     Args:
         author_id: The ID of the author to update.
         author_in: The author data to update.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Returns:
         The updated author.
@@ -121,20 +128,14 @@ def update_author_endpoint(
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     return update_author(session=session, author_id=author_id, author_update=author_in)
 
 
 @router.delete("/{author_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_author_endpoint(
     author_id: int,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> None:
     """Deletes an author.
 
@@ -142,16 +143,10 @@ def delete_author_endpoint(
 
     Args:
         author_id: The ID of the author to delete.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     delete_author(session=session, author_id=author_id)
@@ -1,11 +1,31 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import sqlmodel
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from sqlmodel import Session, select
 
-from src.author.models import Author, AuthorCreate, AuthorUpdate
-from src.pagination import PageResponse, PaginationParams
+from src.author.models import Author, AuthorCreate, AuthorResponse, AuthorUpdate
+from src.cache import TTLCache
+from src.pagination import (
+    PageResponse,
+    PaginationParams,
+    decode_typed_cursor,
+    encode_cursor,
+    keyset_condition,
+)
+
+ALL_AUTHORS_BATCH_SIZE = 500
+
+AUTHOR_CACHE_MAXSIZE = 4096
+AUTHOR_CACHE_TTL_SECONDS = 60
+
+_author_cache: TTLCache[int, Author] = TTLCache(
+    maxsize=AUTHOR_CACHE_MAXSIZE, ttl=AUTHOR_CACHE_TTL_SECONDS
+)
+"""Detached authors keyed by ID, served by `get_author_cached`."""
+
+_author_list_adapter = TypeAdapter(List[AuthorResponse])
 
 
 def create_author(session: Session, author_create: AuthorCreate) -> Author:
@@ -18,48 +38,108 @@ def create_author(session: Session, author_create: AuthorCreate) -> Author:
     Returns:
         The created author.
     """
-    author = Author.model_validate(author_create)
+    # Table models skip validation on construction; the request body has
+    # already been validated by FastAPI
+    author = Author(
+        author_name=author_create.author_name, author_bio=author_create.author_bio
+    )
     session.add(author)
     session.commit()
-    session.refresh(author)
     return author
 
 
-def get_all_authors(session: Session) -> List[Author]:
-    """Gets all authors.
+def stream_all_authors_json(
+    session: Session, batch_size: int = ALL_AUTHORS_BATCH_SIZE
+) -> Iterator[bytes]:
+    """Streams all authors as a JSON array, one batch of rows at a time.
+
+    Rows are fetched from a server-side cursor and serialized per batch, so
+    memory use is bounded by the batch size rather than the table size.
 
     Args:
-        session: The database session.
+        session: The database session; it must stay open until the iterator
+                 is exhausted.
+        batch_size: The number of rows fetched and serialized at a time.
 
-    Returns:
-        A list of all authors.
+    Yields:
+        Chunks of the JSON encoded list of `AuthorResponse` objects.
     """
-    statement = select(Author).order_by(Author.author_name)
-    results = session.exec(statement)
-    return results.all()
-
-
-def get_authors(session: Session, pagination: PaginationParams) -> PageResponse[Author]:
+    statement = (
+        select(Author)
+        .order_by(Author.author_name)
+        .execution_options(yield_per=batch_size)
+    )
+    yield b"["
+    separator = b""
+    for batch in session.exec(statement).partitions():
+        authors = _author_list_adapter.validate_python(batch, from_attributes=True)
+        # Strip the brackets so batches join into a single array
+        yield separator + _author_list_adapter.dump_json(authors)[1:-1]
+        separator = b","
+    yield b"]"
+
+
+def get_authors(
+    session: Session, pagination: PaginationParams, cursor: Optional[str] = None
+) -> PageResponse[Author]:
     """Gets a paginated list of authors.
 
+    Authors are ordered by name, with the ID breaking ties. When a cursor
+    from a previous page is given, the page starts right after it instead of
+    at the page offset, so deep pages cost no more than the first one.
+
     Args:
         session: The database session.
         pagination: The pagination parameters.
+        cursor: Optional `next_cursor` of the previous page.
 
     Returns:
         A paginated response containing authors.
+
+    Raises:
+        BadRequestError: If the cursor is malformed.
     """
-    statement = select(Author).order_by(Author.author_name)
-    results = session.exec(
-        statement.offset(pagination.offset).limit(pagination.page_size)
-    )
-    authors = results.all()
-    count_statement = select(sqlmodel.func.count()).select_from(Author)
-    total = session.exec(count_statement).one()
+    order = [(Author.author_name, False), (Author.id, False)]
+    if cursor is not None:
+        # With a cursor the window count would only cover the remaining rows
+        statement = (
+            select(Author)
+            .where(keyset_condition(order, decode_typed_cursor(cursor, [str, int])))
+            .order_by(Author.author_name, Author.id)
+            .limit(pagination.page_size + 1)
+        )
+        authors = session.exec(statement).all()
+        total = session.exec(select(sqlmodel.func.count()).select_from(Author)).one()
+    else:
+        # The total rides along on every row, saving a separate COUNT round trip
+        statement = (
+            select(Author, sqlmodel.func.count().over().label("total"))
+            .order_by(Author.author_name, Author.id)
+            .offset(pagination.offset)
+            .limit(pagination.page_size + 1)
+        )
+        rows = session.exec(statement).all()
+        authors = [author for author, _ in rows]
+        if rows:
+            total = rows[0].total
+        elif pagination.offset > 0:
+            # Past the last page there are no rows to carry the total
+            total = session.exec(
+                select(sqlmodel.func.count()).select_from(Author)
+            ).one()
+        else:
+            total = 0
+
+    # The extra row only tells whether another page follows
+    next_cursor = None
+    if len(authors) > pagination.page_size:
+        authors = authors[: pagination.page_size]
+        next_cursor = encode_cursor([authors[-1].author_name, authors[-1].id])
     return PageResponse.create(
         items=authors,
         total=total,
         params=pagination,
+        next_cursor=next_cursor,
     )
 
 
@@ -85,6 +165,31 @@ def get_author(session: Session, author_id: int) -> Author:
     return author
 
 
+def get_author_cached(session: Session, author_id: int) -> Author:
+    """Gets a specific author by ID, answering repeated reads from memory.
+
+    Authors are cached per process for a short TTL and evicted when updated
+    or deleted through this process; other workers may serve the old row
+    until it expires. The returned author is detached, so it must not be
+    modified; use `get_author` for that.
+
+    Args:
+        session: The database session used on a cache miss.
+        author_id: The ID of the author to retrieve.
+
+    Returns:
+        The requested author.
+
+    Raises:
+        HTTPException: If the author is not found.
+    """
+    author = _author_cache.get(author_id)
+    if author is None:
+        author = Author.model_validate(get_author(session, author_id))
+        _author_cache.set(author_id, author)
+    return author
+
+
 def update_author(
     session: Session, author_id: int, author_update: AuthorUpdate
 ) -> Author:
@@ -103,13 +208,12 @@ def update_author(
     """
     author = get_author(session=session, author_id=author_id)
 
-    update_data = author_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(author, field, value)
+    for field in author_update.model_fields_set:
+        setattr(author, field, getattr(author_update, field))
 
     session.add(author)
     session.commit()
-    session.refresh(author)
+    _author_cache.pop(author_id)
     return author
 
 
@@ -126,3 +230,4 @@ def delete_author(session: Session, author_id: int) -> None:
     author = get_author(session=session, author_id=author_id)
     session.delete(author)
     session.commit()
+    _author_cache.pop(author_id)
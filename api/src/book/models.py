@@ -1,7 +1,7 @@
 from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import BigInteger, Numeric
+from sqlalchemy import BigInteger, Index, Numeric
 from sqlmodel import Field, Relationship, SQLModel
 
 from src.author.models import Author
@@ -24,7 +24,7 @@ class BookBase(SQLModel):
         author_id: The ID of the book's author.
     """
 
-    book_title: str = Field(index=True, max_length=255)
+    book_title: str = Field(max_length=255)
     book_summary: Optional[str] = Field(default=None)
     book_price: Decimal = Field(sa_type=Numeric(10, 2), ge=0)
     book_cover_photo: Optional[str] = Field(default=None, max_length=255)
@@ -41,6 +41,15 @@ class Book(BookBase, TimestampModel, table=True):
         author: Relationship to the book's author.
     """
 
+    # Match the default listing order (title, then ID), alone and behind each
+    # filter, so a page is read off the index without sorting every book.
+    # They also serve the foreign key lookups on category and author
+    __table_args__ = (
+        Index("ix_book_title_id", "book_title", "id"),
+        Index("ix_book_category_title_id", "category_id", "book_title", "id"),
+        Index("ix_book_author_title_id", "author_id", "book_title", "id"),
+    )
+
     id: Optional[int] = Field(sa_type=BigInteger, default=None, primary_key=True)
 
     category: Category = Relationship()
@@ -1,10 +1,11 @@
-from typing import Any, List, Optional
+from typing import Any, Callable, Iterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
-from src.auth.dependencies import get_current_user
-from src.auth.models import User
+from src.auth.dependencies import AdminUser
 from src.book.models import BookCreate, BookResponse, BookUpdate
 from src.book.service import (
     SortMode,
@@ -15,20 +16,46 @@ from src.book.service import (
     get_popular_book,
     get_recommended_book,
     get_top_discounted_books,
+    stream_all_books_json,
     update_book,
 )
-from src.database import get_session
+from src.cache import TTLCache
+from src.database import engine, get_session
+from src.http_cache import cacheable_json_response
 from src.pagination import PageResponse, PaginationParams
 
 router = APIRouter(prefix="/books", tags=["books"])
 """Book related routes."""
 
+# The home page lists change rarely, so browsers and CDNs may reuse them,
+# and each worker serves them from memory for as long. Past that, caches may
+# keep showing the old list while they fetch the new one
+BOOK_LIST_MAX_AGE_SECONDS = 60
+BOOK_LIST_STALE_SECONDS = 3600
+BOOK_LIST_CACHE_MAXSIZE = 16
+
+_book_list_adapter = TypeAdapter(List[BookResponse])
+
+_book_list_cache: TTLCache[str, bytes] = TTLCache(
+    maxsize=BOOK_LIST_CACHE_MAXSIZE, ttl=BOOK_LIST_MAX_AGE_SECONDS
+)
+"""Encoded home page book lists keyed by endpoint."""
+
+
+def _cached_book_list_json(key: str, load: Callable[[], List[BookResponse]]) -> bytes:
+    """Returns the encoded book list cached under `key`, loading it on a miss."""
+    content = _book_list_cache.get(key)
+    if content is None:
+        content = _book_list_adapter.dump_json(load())
+        _book_list_cache.set(key, content)
+    return content
+
 
 @router.post("/", response_model=BookResponse, status_code=status.HTTP_201_CREATED)
 def create_book_endpoint(
     book_in: BookCreate,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Creates a new book.
 
@@ -36,8 +63,8 @@ def create_book_endpoint(
 
     Args:
         book_in: The book data for creation.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Returns:
         The created book.
@@ -45,60 +72,103 @@ def create_book_endpoint(
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     return create_book(session=session, book_create=book_in)
 
 
 @router.get("/recommended", response_model=List[BookResponse])
 def get_recommended_endpoint(
+    request: Request,
     session: Session = Depends(get_session),
 ) -> Any:
     """Gets the recommended books for the current user.
 
+    The list is cached for a minute, by this worker and by clients.
+
     Args:
-        session: The database session dependency.
+        request: The incoming request.
         current_user: The authenticated user dependency.
+        session: The database session dependency.
 
     Returns:
         A list of recommended books.
     """
-    return get_recommended_book(session=session)
+    content = _cached_book_list_json(
+        "recommended", lambda: get_recommended_book(session=session)
+    )
+    return cacheable_json_response(
+        request, content, BOOK_LIST_MAX_AGE_SECONDS, BOOK_LIST_STALE_SECONDS
+    )
 
 
 @router.get("/popular", response_model=List[BookResponse])
 def get_popular_endpoint(
+    request: Request,
     session: Session = Depends(get_session),
 ) -> Any:
     """Gets the popular books.
 
+    The list is cached for a minute, by this worker and by clients.
+
     Args:
+        request: The incoming request.
         session: The database session dependency.
 
     Returns:
         A list of popular books.
     """
-    return get_popular_book(session=session)
+    content = _cached_book_list_json(
+        "popular", lambda: get_popular_book(session=session)
+    )
+    return cacheable_json_response(
+        request, content, BOOK_LIST_MAX_AGE_SECONDS, BOOK_LIST_STALE_SECONDS
+    )
 
 
 @router.get("/top-discounted", response_model=List[BookResponse])
 def get_top_discounted_endpoint(
+    request: Request,
     session: Session = Depends(get_session),
 ) -> Any:
     """Gets the top discounted books.
 
+    The list is cached for a minute, by this worker and by clients.
+
     Args:
+        request: The incoming request.
         pagination: The pagination parameters dependency.
         session: The database session dependency.
 
     Returns:
         A paginated response containing the top discounted books.
     """
-    return get_top_discounted_books(session=session)
+    content = _cached_book_list_json(
+        "top_discounted", lambda: get_top_discounted_books(session=session)
+    )
+    return cacheable_json_response(
+        request, content, BOOK_LIST_MAX_AGE_SECONDS, BOOK_LIST_STALE_SECONDS
+    )
+
+
+@router.get("/all", response_model=List[BookResponse])
+def read_all_books(current_user: AdminUser) -> StreamingResponse:
+    """Gets all books, for exports.
+
+    Only admins can export books. The list is streamed as it is read from
+    the database. The stream opens its own session because request-scoped
+    dependencies are closed before the response body is sent.
+
+    Args:
+        current_user: The authenticated admin user dependency.
+
+    Returns:
+        A streaming JSON response with a list of all books.
+    """
+
+    def stream() -> Iterator[bytes]:
+        with Session(engine) as session:
+            yield from stream_all_books_json(session=session)
+
+    return StreamingResponse(stream(), media_type="application/json")
 
 
 @router.get("/", response_model=PageResponse[BookResponse])
@@ -110,29 +180,40 @@ def read_books(
         None, ge=1, le=5, description="Filter by min rating (1 to 5)"
     ),
     sort_mode: Optional[SortMode] = None,
+    cursor: Optional[str] = Query(
+        None, description="The next_cursor of the previous page"
+    ),
     session: Session = Depends(get_session),
 ) -> Any:
     """Gets a paginated list of books with optional filtering.
 
+    Pass the `next_cursor` of a response as `cursor`, with the same sort mode,
+    to fetch the following page without an offset.
+
     Args:
         pagination: The pagination parameters dependency.
         category_id: Optional filter by category ID.
         author_id: Optional filter by author ID.
         rating: Optional filter by rating (1 to 5).
         sort_mode: Optional sorting mode for books.
+        cursor: Optional keyset pagination cursor.
         session: The database session dependency.
 
     Returns:
         A paginated response containing books.
     """
-    return get_books(
+    page = get_books(
         session=session,
         pagination=pagination,
         category_id=category_id,
         author_id=author_id,
         rating=min_rating,
         sort_mode=sort_mode,
+        cursor=cursor,
     )
+    # Serialized directly; FastAPI would otherwise validate every item again
+    # against the response model it was just built from
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{book_id}", response_model=BookResponse)
@@ -156,8 +237,8 @@ def read_book(
 def update_book_endpoint(
     book_id: int,
     book_in: BookUpdate,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Updates a book.
 
@@ -166,8 +247,8 @@ def update_book_endpoint(
     Args:
         book_id: The ID of the book to update.
         book_in: The book data to update.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Returns:
         The updated book.
@@ -175,20 +256,14 @@ def update_book_endpoint(
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     return update_book(session=session, book_id=book_id, book_update=book_in)
 
 
 @router.delete("/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_book_endpoint(
     book_id: int,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> None:
     """Deletes a book.
 
@@ -196,33 +271,10 @@ def delete_book_endpoint(
 
     Args:
         book_id: The ID of the book to delete.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     delete_book(session=session, book_id=book_id)
-
-
-# Use different
-# @router.get("/featured/{featured_type}", response_model=List[BookResponse])
-# def get_featured_books(
-#     featured_type: FeaturedBook,
-#     session: Session = Depends(get_session),
-# ) -> Any:
-#     """Gets the featured books.
-
-#     Args:
-#         session: The database session dependency.
-
-#     Returns:
-#         A list of featured books.
-#     """
-#     return get_featured_book(session=session, feature=featured_type)
@@ -1,18 +1,40 @@
-from datetime import datetime, date
+from decimal import Decimal
 from enum import Enum
-from typing import List, Optional
-
-import sqlmodel
-from sqlmodel import Session, select, func, or_
-from sqlalchemy import Float
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from sqlmodel import Session, select, func
+from sqlalchemy import (
+    BigInteger,
+    Row,
+    Float,
+    FromClause,
+    Numeric,
+    ColumnElement,
+    Select,
+    Subquery,
+    bindparam,
+    column,
+    delete,
+    table,
+    text,
+    update,
+)
 from sqlalchemy.sql.functions import coalesce
-from sqlalchemy.orm import aliased
+from sqlalchemy.orm import Bundle, aliased
 
 from src.author.models import Author
-from src.book.models import Book, BookCreate, BookResponse, BookUpdate
-from src.discount.models import Discount
+from src.cache import TTLCache
+from src.book.models import Book, BookBase, BookCreate, BookResponse, BookUpdate
 from src.exceptions import NotFoundError
-from src.pagination import PageResponse, PaginationParams
+from src.pagination import (
+    PageResponse,
+    PaginationParams,
+    decode_typed_cursor,
+    encode_cursor,
+    keyset_condition,
+)
 from src.review.models import Review
 
 
@@ -25,6 +47,116 @@ class SortMode(Enum):
     PRICE_HIGH_TO_LOW = "price_high_to_low"
 
 
+# Sort keys per mode as (key, descending) pairs. Each ends with the ID so the
+# order is total, which keyset pagination relies on.
+SORT_KEYS = {
+    SortMode.ON_SALE: [
+        ("discount_amount", True),
+        ("final_price", False),
+        ("id", False),
+    ],
+    SortMode.POPULARITY: [
+        ("review_count", True),
+        ("final_price", False),
+        ("id", False),
+    ],
+    SortMode.PRICE_LOW_TO_HIGH: [("final_price", False), ("id", False)],
+    SortMode.PRICE_HIGH_TO_LOW: [("final_price", True), ("id", False)],
+}
+DEFAULT_SORT_KEYS = [("book_title", False), ("id", False)]
+
+# The type each sort key must have in a cursor
+SORT_KEY_TYPES = {
+    "book_title": str,
+    "discount_amount": Decimal,
+    "final_price": Decimal,
+    "review_count": int,
+    "id": int,
+}
+
+ALL_BOOKS_BATCH_SIZE = 500
+
+BOOK_COUNT_CACHE_MAXSIZE = 1024
+BOOK_COUNT_CACHE_TTL_SECONDS = 30
+
+_book_count_cache: TTLCache[tuple, int] = TTLCache(
+    maxsize=BOOK_COUNT_CACHE_MAXSIZE, ttl=BOOK_COUNT_CACHE_TTL_SECONDS
+)
+"""Totals of `get_books` keyed by `(category_id, author_id, rating)`."""
+
+top_discounted_book = table(
+    "top_discounted_book",
+    column("book_id", BigInteger),
+    column("discount_amount", Numeric(10, 2)),
+    column("best_discount_price", Numeric(10, 2)),
+)
+"""Materialized view of the best active discount per book.
+
+Listings join it for discounted prices instead of aggregating the discounts
+on every request.
+"""
+
+book_rating = table(
+    "book_rating",
+    column("book_id", BigInteger),
+    column("avg_rating", Numeric),
+    column("review_count", BigInteger),
+)
+"""Materialized view of the review statistics per reviewed book.
+
+The recommended and popular books are ranked from it instead of aggregating
+every review on each request.
+"""
+
+_book_list_adapter = TypeAdapter(List[BookResponse])
+
+# The book columns of `BookResponse`; queries select them instead of the
+# `Book` entity, skipping the timestamps and the ORM identity map per row
+_BOOK_RESPONSE_COLUMNS = Bundle(
+    "book", Book.id, *(getattr(Book, name) for name in BookBase.model_fields)
+)
+
+# Built once and bound per call, as `get_book` backs every book detail page.
+# The view holds at most one row per book, so a book with several discounts
+# still yields a single row, priced like in the listings.
+_BOOK_BY_ID_STMT = (
+    select(
+        _BOOK_RESPONSE_COLUMNS,
+        Author.author_name,
+        top_discounted_book.c.best_discount_price,
+    )
+    .join(Author, Book.author_id == Author.id, isouter=True)
+    .join(
+        top_discounted_book,
+        top_discounted_book.c.book_id == Book.id,
+        isouter=True,
+    )
+    .where(Book.id == bindparam("book_id"))
+)
+
+
+def _book_response(
+    book: Row, author_name: Optional[str], final_price: Optional[Decimal]
+) -> BookResponse:
+    """Builds a listing entry from a queried row.
+
+    `book` holds the `_BOOK_RESPONSE_COLUMNS` of the row. The values come
+    straight from the database, so the response is constructed without
+    running validation on every field again.
+    """
+    discount_price = (
+        final_price
+        if final_price is not None and final_price < book.book_price
+        else None
+    )
+    return BookResponse.model_construct(
+        **{name: getattr(book, name) for name in BookBase.model_fields},
+        id=book.id,
+        discount_price=discount_price,
+        author_name=author_name,
+    )
+
+
 def create_book(session: Session, book_create: BookCreate) -> BookResponse:
     """Creates a new book.
 
@@ -38,7 +170,7 @@ def create_book(session: Session, book_create: BookCreate) -> BookResponse:
     book = Book.model_validate(book_create)
     session.add(book)
     session.commit()
-    session.refresh(book)
+    _book_count_cache.clear()
     return book
 
 
@@ -55,21 +187,133 @@ def get_book(session: Session, book_id: int) -> BookResponse:
     Raises:
         NotFoundError: If the book doesn't exist.
     """
-    statement = (
-        select(Book, Discount.discount_price, Author.author_name)
-        .join(Discount, isouter=True)
-        .join(Author, isouter=True)
-        .where(Book.id == book_id)
-    )
-    book = session.exec(statement).first()
+    row = session.exec(_BOOK_BY_ID_STMT, params={"book_id": book_id}).first()
+    if not row:
+        raise NotFoundError("Book not found")
+    return _book_response(*row)
+
+
+def get_book_model(session: Session, book_id: int) -> Book:
+    """Gets the database row of a book by ID.
+
+    A primary key lookup, answered from the session's identity map when the
+    book is already loaded. Use it when the book is to be modified or only
+    its own columns are needed; use `get_book` for responses.
+
+    Args:
+        session: The database session.
+        book_id: The ID of the book to retrieve.
+
+    Returns:
+        The requested book.
+
+    Raises:
+        NotFoundError: If the book doesn't exist.
+    """
+    book = session.get(Book, book_id)
     if not book:
         raise NotFoundError("Book not found")
-    book, discount_price, author_name = book
-    book_response = BookResponse.model_validate(book)
-    book_response.discount_price = discount_price
-    book_response.author_name = author_name
+    return book
+
+
+def _review_stats_subquery() -> Subquery:
+    """Selects the average rating and number of reviews per reviewed book."""
+    return (
+        select(
+            Review.book_id,
+            func.avg(Review.rating).label("avg_rating"),
+            func.count().label("review_count"),
+        )
+        .group_by(Review.book_id)
+        .subquery()
+    )
+
+
+def _final_price() -> ColumnElement:
+    """Selects the price of a book after its best active discount.
+
+    The statement must outer join `top_discounted_book` on the book ID.
+    """
+    return coalesce(top_discounted_book.c.best_discount_price, Book.book_price).label(
+        "final_price"
+    )
 
-    return book_response
+
+def _review_count(review_stats: FromClause) -> ColumnElement:
+    """Selects the number of reviews of a book.
+
+    `review_stats` is a `_review_stats_subquery` or the `book_rating` view.
+    """
+    return coalesce(review_stats.c.review_count, 0).label("review_count")
+
+
+def _build_book_listings() -> (
+    Dict[Optional[SortMode], Tuple[Select, List[Tuple[ColumnElement, bool]]]]
+):
+    """Builds the ordered listing statement and sort order for every sort mode.
+
+    The statements only depend on the sort mode, so they are built once at
+    import; `get_books` just adds the filters of the request.
+    """
+    final_price = _final_price()
+
+    review_stats_subquery = _LISTING_REVIEW_STATS
+    avg_rating = _LISTING_AVG_RATING
+    review_count = _review_count(review_stats_subquery)
+
+    statement = (
+        select(
+            _BOOK_RESPONSE_COLUMNS,
+            Author.author_name,
+            final_price,
+            avg_rating,
+            review_count,
+        )
+        .outerjoin(Author, Book.author_id == Author.id)
+        .outerjoin(top_discounted_book, Book.id == top_discounted_book.c.book_id)
+        .outerjoin(review_stats_subquery, Book.id == review_stats_subquery.c.book_id)
+    )
+
+    # Computed from the live book price, exactly as the cursor is; the view's
+    # own discount_amount can lag behind price edits until its next refresh
+    discount_amount = (Book.book_price - final_price).label("discount_amount")
+    sort_columns = {
+        "book_title": Book.book_title,
+        "discount_amount": discount_amount,
+        "final_price": final_price,
+        "review_count": review_count,
+        "id": Book.id,
+    }
+    listings = {}
+    for sort_mode in [None, *SortMode]:
+        sort_keys = SORT_KEYS.get(sort_mode, DEFAULT_SORT_KEYS)
+        order = [(sort_columns[name], descending) for name, descending in sort_keys]
+        ordered_statement = statement.order_by(
+            *(
+                column.desc() if descending else column.asc()
+                for column, descending in order
+            )
+        )
+        listings[sort_mode] = (ordered_statement, order)
+    return listings
+
+
+# Reviews are aggregated on their own, so the book rows never need grouping
+# and the rating and review count can be filtered on like plain columns
+_LISTING_REVIEW_STATS = _review_stats_subquery()
+_LISTING_AVG_RATING = (
+    coalesce(_LISTING_REVIEW_STATS.c.avg_rating, 0.0).cast(Float).label("avg_rating")
+)
+
+_BOOK_LISTINGS = _build_book_listings()
+
+# Totals only need the joins their filters use; the discount and author
+# joins and the ORDER BY of the listings never change the count. The rating
+# filter only matches reviewed books, so the rated count joins inner
+_BOOK_COUNT_STMT = select(func.count()).select_from(Book)
+_RATED_BOOK_COUNT_STMT = _BOOK_COUNT_STMT.join(
+    _LISTING_REVIEW_STATS, Book.id == _LISTING_REVIEW_STATS.c.book_id
+)
 
 
 def get_books(
@@ -79,9 +323,15 @@ def get_books(
     author_id: Optional[int] = None,
     rating: Optional[int] = None,
     sort_mode: Optional[SortMode] = None,
+    cursor: Optional[str] = None,
 ) -> PageResponse[BookResponse]:
     """Gets a paginated list of books with optional filtering and sorting.
 
+    When a cursor from a previous page is given, the page starts right after
+    it (keyset pagination) instead of at the page offset, so deep pages cost
+    no more than the first one. The cursor must come from a request with the
+    same sort mode.
+
     Args:
         session: The database session.
         pagination: Pagination parameters.
@@ -89,96 +339,121 @@ def get_books(
         author_id: Optional filter by author ID.
         rating: Optional filter by minimum average rating.
         sort_mode: Optional sorting mode.
+        cursor: Optional `next_cursor` of the previous page.
 
     Returns:
         A paginated response containing books.
-    """
-    today = date.today()
 
-    active_discount_subquery = (
-        select(
-            Discount.book_id,
-            func.min(Discount.discount_price).label("best_discount_price"),
-        )
-        .where(
-            or_(
-                Discount.discount_start_date.is_(None),
-                Discount.discount_start_date <= today,
-            ),
-            or_(
-                Discount.discount_end_date.is_(None),
-                Discount.discount_end_date >= today,
-            ),
-        )
-        .group_by(Discount.book_id)
-        .subquery()
-    )
-
-    final_price = coalesce(
-        active_discount_subquery.c.best_discount_price, Book.book_price
-    ).label("final_price")
-
-    avg_rating = coalesce(func.avg(Review.rating), 0.0).cast(Float).label("avg_rating")
-    review_count = func.count(Review.id).label("review_count")
-
-    statement = (
-        select(Book, Author.author_name, final_price, avg_rating, review_count)
-        .outerjoin(Author, Book.author_id == Author.id)
-        .outerjoin(
-            active_discount_subquery, Book.id == active_discount_subquery.c.book_id
-        )
-        .outerjoin(Review, Book.id == Review.book_id)
-        .group_by(
-            Book.id, Author.author_name, active_discount_subquery.c.best_discount_price
-        )
-    )
+    Raises:
+        BadRequestError: If the cursor is malformed.
+    """
+    sort_keys = SORT_KEYS.get(sort_mode, DEFAULT_SORT_KEYS)
+    statement, order = _BOOK_LISTINGS[sort_mode]
 
+    filters = []
     if category_id is not None:
-        statement = statement.where(Book.category_id == category_id)
+        filters.append(Book.category_id == category_id)
     if author_id is not None:
-        statement = statement.where(Book.author_id == author_id)
+        filters.append(Book.author_id == author_id)
     if rating is not None:
-        statement = statement.having(avg_rating >= rating)
-
-    if sort_mode == SortMode.ON_SALE:
-        discount_amount = (Book.book_price - final_price).label("discount_amount")
-        statement = statement.order_by(
-            discount_amount.desc(), final_price.asc(), Book.id.asc()
-        )
-    elif sort_mode == SortMode.POPULARITY:
-        statement = statement.order_by(
-            review_count.desc(), final_price.asc(), Book.id.asc()
+        # Compared on the raw average, not the coalesced one: ratings start at
+        # 1, so unreviewed books never match, and a NULL-rejecting condition
+        # lets Postgres turn the outer join into an inner one and filter the
+        # review aggregate before joining it to the books
+        filters.append(_LISTING_REVIEW_STATS.c.avg_rating >= rating)
+    statement = statement.where(*filters)
+
+    # The sort mode does not change the total, so only the filters key it.
+    # Book writes clear the cache; new reviews (which move the rating filter)
+    # show up once the entry expires
+    count_key = (category_id, author_id, rating)
+    total = _book_count_cache.get(count_key)
+
+    if cursor is not None:
+        values = decode_typed_cursor(
+            cursor, [SORT_KEY_TYPES[name] for name, _ in sort_keys]
         )
-    elif sort_mode == SortMode.PRICE_LOW_TO_HIGH:
-        statement = statement.order_by(final_price.asc(), Book.id.asc())
-    elif sort_mode == SortMode.PRICE_HIGH_TO_LOW:
-        statement = statement.order_by(final_price.desc(), Book.id.asc())
+        keyset_statement = statement.where(keyset_condition(order, values))
+        results = session.exec(keyset_statement.limit(pagination.page_size + 1)).all()
     else:
-        statement = statement.order_by(Book.book_title.asc(), Book.id.asc())
+        # The total rides along on every row, saving a separate COUNT round trip
+        paginated_statement = (
+            statement.add_columns(func.count().over().label("total"))
+            .offset(pagination.offset)
+            .limit(pagination.page_size + 1)
+        )
+        rows = session.exec(paginated_statement).all()
+        results = [row[:-1] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif pagination.offset == 0:
+            total = 0
+        if total is not None:
+            _book_count_cache.set(count_key, total)
+
+    if total is None:
+        # With a cursor the window count would only cover the remaining rows,
+        # and past the last page there are no rows to carry it
+        count_statement = (
+            _RATED_BOOK_COUNT_STMT if rating is not None else _BOOK_COUNT_STMT
+        ).where(*filters)
+        total = session.exec(count_statement).one()
+        _book_count_cache.set(count_key, total)
+
+    # The extra row only tells whether another page follows
+    next_cursor = None
+    if len(results) > pagination.page_size:
+        results = results[: pagination.page_size]
+        book, _, last_final_price, _, last_review_count = results[-1]
+        last_values = {
+            "book_title": book.book_title,
+            "discount_amount": book.book_price - last_final_price,
+            "final_price": last_final_price,
+            "review_count": last_review_count,
+            "id": book.id,
+        }
+        next_cursor = encode_cursor([last_values[name] for name, _ in sort_keys])
+
+    books_response = [
+        _book_response(book, author_name, calculated_final_price)
+        for book, author_name, calculated_final_price, _, _ in results
+    ]
+
+    return PageResponse.create(
+        items=books_response, total=total, params=pagination, next_cursor=next_cursor
+    )
 
-    count_subquery = statement.with_only_columns(Book.id).alias("count_sq")
-    count_statement = select(func.count(count_subquery.c.id))
-    total = session.exec(count_statement).first() or 0
 
-    paginated_statement = statement.offset(pagination.offset).limit(
-        pagination.page_size
-    )
-    results = session.exec(paginated_statement).all()
+def stream_all_books_json(
+    session: Session, batch_size: int = ALL_BOOKS_BATCH_SIZE
+) -> Iterator[bytes]:
+    """Streams all books as a JSON array, one batch of rows at a time.
 
-    books_response = []
-    for book, author_name, calculated_final_price, _, _ in results:
-        book_resp = BookResponse.model_validate(book)
-        book_resp.author_name = author_name
-        if (
-            calculated_final_price is not None
-            and calculated_final_price < book.book_price
-        ):
-            book_resp.discount_price = calculated_final_price
-        else:
-            book_resp.discount_price = None
-        books_response.append(book_resp)
+    Books are listed as by `get_books` without a sort mode. Rows are fetched
+    from a server-side cursor and serialized per batch, so memory use is
+    bounded by the batch size rather than the table size.
 
-    return PageResponse.create(items=books_response, total=total, params=pagination)
+    Args:
+        session: The database session; it must stay open until the iterator
+                 is exhausted.
+        batch_size: The number of rows fetched and serialized at a time.
+
+    Yields:
+        Chunks of the JSON encoded list of `BookResponse` objects.
+    """
+    statement, _ = _BOOK_LISTINGS[None]
+    statement = statement.execution_options(yield_per=batch_size)
+    yield b"["
+    separator = b""
+    for batch in session.exec(statement).partitions():
+        books = [
+            _book_response(book, author_name, final_price)
+            for book, author_name, final_price, _, _ in batch
+        ]
+        # Strip the brackets so batches join into a single array
+        yield separator + _book_list_adapter.dump_json(books)[1:-1]
+        separator = b","
+    yield b"]"
 
 
 def update_book(session: Session, book_id: int, book_update: BookUpdate) -> Book:
@@ -195,15 +470,23 @@ def update_book(session: Session, book_id: int, book_update: BookUpdate) -> Book
     Raises:
         NotFoundError: If the book doesn't exist.
     """
-    book = get_book(session, book_id)
-
-    update_data = book_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(book, key, value)
-    book.updated_at = datetime.now()
-    session.add(book)
+    values = {
+        field: getattr(book_update, field) for field in book_update.model_fields_set
+    }
+    if not values:
+        return get_book_model(session, book_id)
+
+    # A single UPDATE ... RETURNING, instead of loading the book first
+    book = session.scalars(
+        update(Book).where(Book.id == book_id).values(**values).returning(Book)
+    ).first()
+    if not book:
+        raise NotFoundError("Book not found")
     session.commit()
-    session.refresh(book)
+    _book_count_cache.clear()
+    if "book_price" in values:
+        # The view ranks discounts by their amount off the book price
+        refresh_top_discounted_books(session)
     return book
 
 
@@ -217,14 +500,110 @@ def delete_book(session: Session, book_id: int) -> None:
     Raises:
         NotFoundError: If the book doesn't exist.
     """
-    book = get_book(session, book_id)
-    session.delete(book)
+    result = session.exec(delete(Book).where(Book.id == book_id))
+    if result.rowcount == 0:
+        raise NotFoundError("Book not found")
     session.commit()
+    _book_count_cache.clear()
+
+
+def _build_top_discounted_books_stmt() -> Select:
+    """Builds the top discounted books query, with the limit as a parameter."""
+    # Ordered like the view's ranking index, so only `limit` entries are read
+    top_subquery = (
+        select(
+            top_discounted_book.c.book_id,
+            top_discounted_book.c.discount_amount,
+            top_discounted_book.c.best_discount_price,
+        )
+        .order_by(
+            top_discounted_book.c.discount_amount.desc(),
+            top_discounted_book.c.best_discount_price.asc(),
+            top_discounted_book.c.book_id.asc(),
+        )
+        .limit(bindparam("limit"))
+        .subquery()
+    )
+
+    final_price = top_subquery.c.best_discount_price.label("final_price")
+
+    return (
+        select(
+            _BOOK_RESPONSE_COLUMNS,
+            Author.author_name,
+            final_price,
+            top_subquery.c.discount_amount,
+        )
+        .join(top_subquery, Book.id == top_subquery.c.book_id)
+        .join(Author, Book.author_id == Author.id)
+        .order_by(
+            top_subquery.c.discount_amount.desc(), final_price.asc(), Book.id.asc()
+        )
+    )
+
+
+def _build_recommended_books_stmt() -> Select:
+    """Builds the recommended books query, with the limit as a parameter."""
+    top_rated_books_subquery = (
+        select(book_rating.c.book_id.label("id"), book_rating.c.avg_rating)
+        .order_by(book_rating.c.avg_rating.desc(), book_rating.c.book_id.asc())
+        .limit(bindparam("limit"))
+        .subquery()
+    )
+
+    final_price = _final_price()
+
+    return (
+        select(
+            _BOOK_RESPONSE_COLUMNS,
+            Author.author_name,
+            final_price,
+            top_rated_books_subquery.c.avg_rating,
+        )
+        .join(top_rated_books_subquery, Book.id == top_rated_books_subquery.c.id)
+        .outerjoin(Author, Book.author_id == Author.id)
+        .outerjoin(top_discounted_book, Book.id == top_discounted_book.c.book_id)
+        .order_by(
+            top_rated_books_subquery.c.avg_rating.desc(),
+            final_price.asc(),
+            Book.id.asc(),
+        )
+    )
+
+
+def _build_popular_books_stmt() -> Select:
+    """Builds the popular books query, with the limit as a parameter."""
+    final_price = _final_price()
+
+    review_count = _review_count(book_rating)
+
+    return (
+        select(
+            _BOOK_RESPONSE_COLUMNS,
+            Author.author_name,
+            final_price,
+            review_count,
+        )
+        .outerjoin(Author, Book.author_id == Author.id)
+        .outerjoin(top_discounted_book, Book.id == top_discounted_book.c.book_id)
+        .outerjoin(book_rating, Book.id == book_rating.c.book_id)
+        .order_by(review_count.desc(), final_price.asc(), Book.id.asc())
+        .limit(bindparam("limit"))
+    )
+
+
+# The home page lists only vary by their limit, so they are built once
+_TOP_DISCOUNTED_BOOKS_STMT = _build_top_discounted_books_stmt()
+_RECOMMENDED_BOOKS_STMT = _build_recommended_books_stmt()
+_POPULAR_BOOKS_STMT = _build_popular_books_stmt()
 
 
 def get_top_discounted_books(session: Session, limit: int = 10) -> List[BookResponse]:
     """Gets the top discounted books currently active.
 
+    Discounts are read from the `top_discounted_book` materialized view, so
+    changes show up after the next `refresh_top_discounted_books`.
+
     Args:
         session: The database session.
         limit: The maximum number of books to retrieve.
@@ -232,65 +611,45 @@ def get_top_discounted_books(session: Session, limit: int = 10) -> List[BookResp
     Returns:
         A list of the top discounted books as BookResponse objects.
     """
-    today = date.today()
+    results = session.exec(_TOP_DISCOUNTED_BOOKS_STMT, params={"limit": limit}).all()
 
-    base_subquery_stmt = (
-        select(
-            Discount.book_id,
-            sqlmodel.func.max(Book.book_price - Discount.discount_price).label(
-                "discount_amount"
-            ),
-            sqlmodel.func.min(Discount.discount_price).label("best_discount_price"),
-        )
-        .join(Book, Discount.book_id == Book.id)
-        .where(
-            or_(
-                Discount.discount_start_date.is_(None),
-                Discount.discount_start_date <= today,
-            ),
-            or_(
-                Discount.discount_end_date.is_(None),
-                Discount.discount_end_date >= today,
-            ),
-        )
-        .group_by(Discount.book_id)
-        .order_by(sqlmodel.text("discount_amount DESC"))
-    )
+    books_response = [
+        _book_response(book, author_name, calculated_final_price)
+        for book, author_name, calculated_final_price, _ in results
+    ]
 
-    subquery = base_subquery_stmt.limit(limit).subquery()
+    return books_response
 
-    final_price = coalesce(subquery.c.best_discount_price, Book.book_price).label(
-        "final_price"
-    )
 
-    statement = (
-        select(Book, Author.author_name, final_price, subquery.c.discount_amount)
-        .join(subquery, Book.id == subquery.c.book_id)
-        .join(Author, Book.author_id == Author.id)
-        .order_by(subquery.c.discount_amount.desc(), final_price.asc(), Book.id.asc())
-    )
+def refresh_top_discounted_books(session: Session) -> None:
+    """Recomputes the `top_discounted_book` view from the current discounts and prices.
 
-    results = session.exec(statement).all()
-
-    books_response = []
-    for book, author_name, calculated_final_price, _ in results:
-        book_resp = BookResponse.model_validate(book)
-        book_resp.author_name = author_name
-        if (
-            calculated_final_price is not None
-            and calculated_final_price < book.book_price
-        ):
-            book_resp.discount_price = calculated_final_price
-        else:
-            book_resp.discount_price = None
-        books_response.append(book_resp)
+    The view is refreshed concurrently, so readers keep seeing the previous
+    contents until the refresh commits.
 
-    return books_response
+    Args:
+        session: The database session.
+    """
+    session.exec(text("REFRESH MATERIALIZED VIEW CONCURRENTLY top_discounted_book"))
+    session.commit()
+
+
+def refresh_book_ratings(session: Session) -> None:
+    """Recomputes the `book_rating` view from the current reviews.
+
+    Args:
+        session: The database session.
+    """
+    session.exec(text("REFRESH MATERIALIZED VIEW CONCURRENTLY book_rating"))
+    session.commit()
 
 
 def get_recommended_book(session: Session, limit: int = 8) -> List[BookResponse]:
     """Gets recommended books based on highest average rating, including discount info.
 
+    Ratings are read from the `book_rating` materialized view, so new reviews
+    count after the next `refresh_book_ratings`.
+
     Args:
         session: The database session.
         limit: The maximum number of recommended books to retrieve.
@@ -298,72 +657,12 @@ def get_recommended_book(session: Session, limit: int = 8) -> List[BookResponse]
     Returns:
         A list of recommended books as BookResponse objects.
     """
-    top_rated_books_subquery_stmt = (
-        select(Book.id, func.avg(Review.rating).label("avg_rating"))
-        .join(Review, Book.id == Review.book_id)
-        .group_by(Book.id)
-        .order_by(func.avg(Review.rating).desc(), Book.id.asc())
-    )
+    raw_results = session.exec(_RECOMMENDED_BOOKS_STMT, params={"limit": limit}).all()
 
-    top_rated_books_subquery = top_rated_books_subquery_stmt.limit(limit).subquery()
-
-    today = date.today()
-    active_discount_subquery = (
-        select(
-            Discount.book_id,
-            func.min(Discount.discount_price).label("best_discount_price"),
-        )
-        .where(
-            or_(
-                Discount.discount_start_date.is_(None),
-                Discount.discount_start_date <= today,
-            ),
-            or_(
-                Discount.discount_end_date.is_(None),
-                Discount.discount_end_date >= today,
-            ),
-        )
-        .group_by(Discount.book_id)
-        .subquery()
-    )
-
-    final_price = coalesce(
-        active_discount_subquery.c.best_discount_price, Book.book_price
-    ).label("final_price")
-
-    statement = (
-        select(
-            Book,
-            Author.author_name,
-            final_price,
-            top_rated_books_subquery.c.avg_rating,
-        )
-        .join(top_rated_books_subquery, Book.id == top_rated_books_subquery.c.id)
-        .outerjoin(Author, Book.author_id == Author.id)
-        .outerjoin(
-            active_discount_subquery, Book.id == active_discount_subquery.c.book_id
-        )
-        .order_by(
-            top_rated_books_subquery.c.avg_rating.desc(),
-            final_price.asc(),
-            Book.id.asc(),
-        )
-    )
-
-    raw_results = session.exec(statement).all()
-
-    books_response = []
-    for book, author_name, calculated_final_price, _ in raw_results:
-        book_resp = BookResponse.model_validate(book)
-        book_resp.author_name = author_name
-        if (
-            calculated_final_price is not None
-            and calculated_final_price < book.book_price
-        ):
-            book_resp.discount_price = calculated_final_price
-        else:
-            book_resp.discount_price = None
-        books_response.append(book_resp)
+    books_response = [
+        _book_response(book, author_name, calculated_final_price)
+        for book, author_name, calculated_final_price, _ in raw_results
+    ]
 
     return books_response
 
@@ -371,6 +670,9 @@ def get_recommended_book(session: Session, limit: int = 8) -> List[BookResponse]
 def get_popular_book(session: Session, limit: int = 8) -> List[BookResponse]:
     """Gets popular books ordered by review count, matching get_books popularity sort.
 
+    Review counts are read from the `book_rating` materialized view, so new
+    reviews count after the next `refresh_book_ratings`.
+
     Args:
         session: The database session.
         limit: The maximum number of popular books to retrieve.
@@ -378,64 +680,11 @@ def get_popular_book(session: Session, limit: int = 8) -> List[BookResponse]:
     Returns:
         A list of popular books as BookResponse objects.
     """
-    today = date.today()
-    active_discount_subquery = (
-        select(
-            Discount.book_id,
-            func.min(Discount.discount_price).label("best_discount_price"),
-        )
-        .where(
-            or_(
-                Discount.discount_start_date.is_(None),
-                Discount.discount_start_date <= today,
-            ),
-            or_(
-                Discount.discount_end_date.is_(None),
-                Discount.discount_end_date >= today,
-            ),
-        )
-        .group_by(Discount.book_id)
-        .subquery()
-    )
-
-    final_price = coalesce(
-        active_discount_subquery.c.best_discount_price, Book.book_price
-    ).label("final_price")
-
-    review_count = func.count(Review.id).label("review_count")
-
-    statement = (
-        select(
-            Book,
-            Author.author_name,
-            final_price,
-            review_count,
-        )
-        .outerjoin(Author, Book.author_id == Author.id)
-        .outerjoin(
-            active_discount_subquery, Book.id == active_discount_subquery.c.book_id
-        )
-        .outerjoin(Review, Book.id == Review.book_id)
-        .group_by(
-            Book.id, Author.author_name, active_discount_subquery.c.best_discount_price
-        )
-        .order_by(review_count.desc(), final_price.asc(), Book.id.asc())
-        .limit(limit)
-    )
+    raw_results = session.exec(_POPULAR_BOOKS_STMT, params={"limit": limit}).all()
 
-    raw_results = session.exec(statement).all()
-
-    books_response = []
-    for book, author_name, calculated_final_price, _ in raw_results:
-        book_resp = BookResponse.model_validate(book)
-        book_resp.author_name = author_name
-        if (
-            calculated_final_price is not None
-            and calculated_final_price < book.book_price
-        ):
-            book_resp.discount_price = calculated_final_price
-        else:
-            book_resp.discount_price = None
-        books_response.append(book_resp)
+    books_response = [
+        _book_response(book, author_name, calculated_final_price)
+        for book, author_name, calculated_final_price, _ in raw_results
+    ]
 
     return books_response
@@ -0,0 +1,94 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Generic, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """A thread-safe, size-bounded LRU cache whose entries expire after a TTL.
+
+    Sync endpoints run in FastAPI's thread pool, so all access is guarded by
+    a lock.
+
+    Attributes:
+        maxsize: The maximum number of entries before the least recently used
+                 one is evicted.
+        ttl: The default number of seconds an entry stays valid.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initializes TTLCache.
+
+        Args:
+            maxsize: The maximum number of entries to keep.
+            ttl: The default lifetime of an entry in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Returns the cached value for a key, or `default` if missing or expired.
+
+        Args:
+            key: The cache key.
+            default: The value to return on a miss.
+
+        Returns:
+            The cached value or `default`.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Stores a value, evicting the least recently used entry when full.
+
+        Args:
+            key: The cache key.
+            value: The value to store.
+            ttl: Optional lifetime in seconds overriding the default TTL.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Removes a key and returns its value, or `default` if it is missing.
+
+        Args:
+            key: The cache key.
+            default: The value to return if the key is not cached.
+
+        Returns:
+            The removed value or `default`.
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Returns the number of stored entries, including expired ones."""
+        return len(self._data)
@@ -1,10 +1,9 @@
 from typing import Any, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, status
 from sqlmodel import Session
 
-from src.auth.dependencies import get_current_user
-from src.auth.models import User
+from src.auth.dependencies import AdminUser
 from src.category.models import (
     Category,
     CategoryCreate,
@@ -29,8 +28,8 @@ router = APIRouter(prefix="/categories", tags=["categories"])
 @router.post("/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 def create_category_endpoint(
     category_in: CategoryCreate,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Creates a new category.
 
@@ -38,8 +37,8 @@ def create_category_endpoint(
 
     Args:
         category_in: The category data for creation.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Returns:
         The created category.
@@ -47,12 +46,6 @@ def create_category_endpoint(
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     return create_category(session=session, category_create=category_in)
 
 
@@ -107,8 +100,8 @@ def read_category(
 def update_category_endpoint(
     category_id: int,
     category_in: CategoryUpdate,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Updates a category.
 
@@ -117,8 +110,8 @@ def update_category_endpoint(
     Args:
         category_id: The ID of the category to update.
         category_in: The category data to update.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Returns:
         The updated category.
@@ -126,12 +119,6 @@ def update_category_endpoint(
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     return update_category(
         session=session, category_id=category_id, category_update=category_in
     )
@@ -140,8 +127,8 @@ def update_category_endpoint(
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_category_endpoint(
     category_id: int,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> None:
     """Deletes a category.
 
@@ -149,16 +136,10 @@ def delete_category_endpoint(
 
     Args:
         category_id: The ID of the category to delete.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     delete_category(session=session, category_id=category_id)
@@ -1,11 +1,10 @@
 from typing import List, Optional
 
-import sqlmodel
 from sqlmodel import Session, select
 
 from src.category.models import Category, CategoryCreate, CategoryUpdate
 from src.exceptions import NotFoundError
-from src.pagination import PageResponse, PaginationParams
+from src.pagination import PageResponse, PaginationParams, paginate
 
 
 def create_category(session: Session, category_create: CategoryCreate) -> Category:
@@ -71,14 +70,7 @@ def get_categories(
         A paginated response containing categories.
     """
     statement = select(Category).order_by(Category.category_name)
-    results = session.exec(
-        statement.offset(pagination.offset).limit(pagination.page_size)
-    )
-    categories = results.all()
-    count_statement = select(sqlmodel.func.count()).select_from(Category)
-    total = session.exec(count_statement).one()
-
-    return PageResponse.create(items=categories, total=total, params=pagination)
+    return paginate(session, statement, pagination)
 
 
 def update_category(
@@ -99,9 +91,8 @@ def update_category(
     """
     category = get_category(session, category_id)
 
-    update_data = category_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(category, key, value)
+    for field in category_update.model_fields_set:
+        setattr(category, field, getattr(category_update, field))
 
     session.add(category)
     session.commit()
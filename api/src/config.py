@@ -11,6 +11,9 @@ class Settings(BaseSettings):
         JWT_SECRET_KEY: The secret key for encoding/decoding JWT tokens.
         JWT_ACCESS_TOKEN_EXPIRE_MINUTES: The expiry time for access tokens in minutes.
         JWT_ALGORITHM: The algorithm used for JWT signing.
+        BCRYPT_ROUNDS: The bcrypt cost factor (log2 of the key schedule rounds).
+        WORKER_THREADS: The number of threads running sync endpoints and other
+                        blocking calls concurrently.
     """
 
     model_config = SettingsConfigDict(
@@ -23,6 +26,8 @@ class Settings(BaseSettings):
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int
     JWT_REFRESH_TOKEN_EXPIRE_MINUTES: int
     JWT_ALGORITHM: str
+    BCRYPT_ROUNDS: int = 12
+    WORKER_THREADS: int = 40
 
 
 settings = Settings()
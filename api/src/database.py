@@ -4,9 +4,27 @@ from dotenv import load_dotenv
 from sqlmodel import Session, create_engine
 
 load_dotenv()
-engine = create_engine(os.getenv("DATABASE_URL"))
+
+# Enough connections for every worker thread plus the background jobs, so
+# bursts reuse open connections instead of waiting on new TCP/auth setups.
+# Handing out the most recently used connection first lets the rest of the
+# overflow sit idle and get closed once a burst is over
+DB_POOL_SIZE = 20
+DB_MAX_OVERFLOW = 40
+DB_POOL_RECYCLE_SECONDS = 1800
+
+engine = create_engine(
+    os.getenv("DATABASE_URL"),
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
+    pool_use_lifo=True,
+)
 
 
 def get_session():
-    with Session(engine) as session:
+    # Objects stay loaded after commit, so services can return what they just
+    # wrote without another SELECT
+    with Session(engine, expire_on_commit=False) as session:
         yield session
@@ -19,7 +19,7 @@ class DiscountBase(SQLModel):
         discount_end_date: Optional end date for the discount period.
     """
 
-    book_id: int = Field(sa_type=BigInteger, foreign_key="book.id")
+    book_id: int = Field(sa_type=BigInteger, foreign_key="book.id", index=True)
     discount_price: Decimal = Field(sa_type=Numeric(10, 2), ge=0)
     discount_start_date: Optional[date] = Field(default=None)
     discount_end_date: Optional[date] = Field(default=None)
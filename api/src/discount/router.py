@@ -1,10 +1,9 @@
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlmodel import Session
 
-from src.auth.dependencies import get_current_user
-from src.auth.models import User
+from src.auth.dependencies import AdminUser
 from src.database import get_session
 from src.discount.models import (
     Discount,
@@ -28,8 +27,8 @@ router = APIRouter(prefix="/discounts", tags=["discounts"])
 @router.post("/", response_model=DiscountResponse, status_code=status.HTTP_201_CREATED)
 def create_discount_endpoint(
     discount_in: DiscountCreate,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Creates a new discount.
 
@@ -37,8 +36,8 @@ def create_discount_endpoint(
 
     Args:
         discount_in: The discount data for creation.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Returns:
         The created discount.
@@ -46,12 +45,6 @@ def create_discount_endpoint(
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     return create_discount(session=session, discount_create=discount_in)
 
 
@@ -102,8 +95,8 @@ def read_discount(
 def update_discount_endpoint(
     discount_id: int,
     discount_in: DiscountUpdate,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Updates a discount.
 
@@ -112,8 +105,8 @@ def update_discount_endpoint(
     Args:
         discount_id: The ID of the discount to update.
         discount_in: The discount data to update.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Returns:
         The updated discount.
@@ -121,12 +114,6 @@ def update_discount_endpoint(
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     return update_discount(
         session=session, discount_id=discount_id, discount_update=discount_in
     )
@@ -135,8 +122,8 @@ def update_discount_endpoint(
 @router.delete("/{discount_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_discount_endpoint(
     discount_id: int,
+    current_user: AdminUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> None:
     """Deletes a discount.
 
@@ -144,16 +131,10 @@ def delete_discount_endpoint(
 
     Args:
         discount_id: The ID of the discount to delete.
+        current_user: The authenticated admin user dependency.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Raises:
         HTTPException: If the user is not an admin.
     """
-    if not current_user.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     delete_discount(session=session, discount_id=discount_id)
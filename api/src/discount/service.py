@@ -1,14 +1,13 @@
 from datetime import date
 from typing import Optional
 
-import sqlmodel
 from sqlmodel import Session, select
 
-from src.book.service import get_book
+from src.book.service import get_book_model, refresh_top_discounted_books
 from src.discount.exceptions import InvalidDiscountDataError, OverlappingDiscountError
 from src.discount.models import Discount, DiscountCreate, DiscountUpdate
 from src.exceptions import NotFoundError
-from src.pagination import PageResponse, PaginationParams
+from src.pagination import PageResponse, PaginationParams, paginate
 
 
 def create_discount(session: Session, discount_create: DiscountCreate) -> Discount:
@@ -27,7 +26,7 @@ def create_discount(session: Session, discount_create: DiscountCreate) -> Discou
         OverlappingDiscountError: If there's an overlapping discount period.
     """
     # Verify the book exists
-    get_book(session=session, book_id=discount_create.book_id)
+    get_book_model(session=session, book_id=discount_create.book_id)
 
     if (
         discount_create.discount_start_date
@@ -48,6 +47,7 @@ def create_discount(session: Session, discount_create: DiscountCreate) -> Discou
     session.add(discount)
     session.commit()
     session.refresh(discount)
+    refresh_top_discounted_books(session)
     return discount
 
 
@@ -189,17 +189,7 @@ def get_discounts(
             )
         )
 
-    # Execute with pagination
-    results = session.exec(
-        statement.offset(pagination.offset).limit(pagination.page_size)
-    )
-    discounts = results.all()
-
-    # Get total count for pagination
-    count_statement = select(sqlmodel.func.count()).select_from(statement.subquery())
-    total = session.exec(count_statement).one()
-
-    return PageResponse.create(items=discounts, total=total, params=pagination)
+    return paginate(session, statement, pagination)
 
 
 def update_discount(
@@ -222,7 +212,10 @@ def update_discount(
     """
     discount = get_discount(session, discount_id)
 
-    update_data = discount_update.model_dump(exclude_unset=True)
+    update_data = {
+        field: getattr(discount_update, field)
+        for field in discount_update.model_fields_set
+    }
     if not update_data:
         return discount  # No updates to apply
 
@@ -255,6 +248,7 @@ def update_discount(
     session.add(discount)
     session.commit()
     session.refresh(discount)
+    refresh_top_discounted_books(session)
     return discount
 
 
@@ -271,6 +265,7 @@ def delete_discount(session: Session, discount_id: int) -> None:
     discount = get_discount(session, discount_id)
     session.delete(discount)
     session.commit()
+    refresh_top_discounted_books(session)
 
 
 def get_active_discount_for_book(session: Session, book_id: int) -> Optional[Discount]:
@@ -297,7 +292,8 @@ def get_active_discount_for_book(session: Session, book_id: int) -> Optional[Dis
                 | (Discount.discount_end_date >= today)
             )
         )
-        .order_by(Discount.discount_price.desc() if Discount.discount_price else None)
+        # Same choice as the listings: the lowest price wins
+        .order_by(Discount.discount_price.asc())
     )
 
     return session.exec(statement).first()
@@ -0,0 +1,44 @@
+import hashlib
+
+from fastapi import Request, Response, status
+
+
+def cacheable_json_response(
+    request: Request,
+    content: bytes,
+    max_age: int,
+    stale_while_revalidate: int = 0,
+) -> Response:
+    """Wraps a JSON body in a response that HTTP caches may store and revalidate.
+
+    The ETag is a digest of the body, so it changes exactly when the content
+    does. A request whose `If-None-Match` already names it gets an empty 304.
+
+    Args:
+        request: The incoming request.
+        content: The encoded JSON body.
+        max_age: The number of seconds clients and shared caches may reuse
+                 the response without asking again.
+        stale_while_revalidate: The number of seconds after that during which
+                                caches may still serve the response while
+                                they revalidate it in the background.
+
+    Returns:
+        A 200 response carrying the body, or a 304 response without one.
+    """
+    etag = f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+    cache_control = f"public, max-age={max_age}"
+    if stale_while_revalidate:
+        cache_control += f", stale-while-revalidate={stale_while_revalidate}"
+    headers = {"Cache-Control": cache_control, "ETag": etag}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison, as required for If-None-Match
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -1,19 +1,103 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import asynccontextmanager, suppress
+from typing import Any
+
+import anyio
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlmodel import Session
 
 from src.auth.router import router as auth_router
+from src.auth.service import purge_expired_blacklisted_tokens
 from src.author.router import router as author_router
 from src.book.router import router as book_router
+from src.book.service import refresh_book_ratings, refresh_top_discounted_books
 from src.category.router import router as category_router
+from src.config import settings
+from src.database import engine
 from src.discount.router import router as discount_router
 from src.order.router import router as order_router
 from src.review.router import router as review_router
 
+logger = logging.getLogger(__name__)
+
+BLACKLIST_PURGE_INTERVAL_SECONDS = 300
+TOP_DISCOUNTED_REFRESH_INTERVAL_SECONDS = 300
+BOOK_RATING_REFRESH_INTERVAL_SECONDS = 3600
+
+
+def purge_blacklist() -> int:
+    """Removes expired tokens from the blacklist using a dedicated session."""
+    with Session(engine) as session:
+        return purge_expired_blacklisted_tokens(session)
+
+
+def refresh_top_discounted() -> None:
+    """Refreshes the top discounted books view using a dedicated session."""
+    with Session(engine) as session:
+        refresh_top_discounted_books(session)
+
+
+def refresh_ratings() -> None:
+    """Refreshes the book rating view using a dedicated session."""
+    with Session(engine) as session:
+        refresh_book_ratings(session)
+
+
+async def run_periodically(interval: float, job: Callable[[], Any]) -> None:
+    """Runs a blocking job in a worker thread every `interval` seconds.
+
+    Args:
+        interval: The number of seconds to wait before each run.
+        job: The job to run.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(job)
+        except Exception:
+            # Keep the loop alive and try again on the next run
+            logger.exception("Periodic job %s failed", job.__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Runs background maintenance tasks for the lifetime of the application."""
+    # Sync endpoints wait on the database in these threads, so their number
+    # caps how many requests can have a query in flight at once
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.WORKER_THREADS
+    tasks = [
+        asyncio.create_task(
+            run_periodically(BLACKLIST_PURGE_INTERVAL_SECONDS, purge_blacklist)
+        ),
+        # Also picks up discounts that started or ended since the last refresh
+        asyncio.create_task(
+            run_periodically(
+                TOP_DISCOUNTED_REFRESH_INTERVAL_SECONDS, refresh_top_discounted
+            )
+        ),
+        asyncio.create_task(
+            run_periodically(BOOK_RATING_REFRESH_INTERVAL_SECONDS, refresh_ratings)
+        ),
+    ]
+    yield
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with suppress(asyncio.CancelledError):
+            await task
+
+
 app = FastAPI(
     title="Bookworm API",
     description="API for NashTech Bookworm Assignment",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 """The main FastAPI application instance."""
 
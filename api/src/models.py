@@ -1,15 +1,32 @@
 from datetime import datetime
+from typing import Optional
 
+from sqlalchemy import func
 from sqlmodel import Field, SQLModel
 
 
 class TimestampModel(SQLModel):
     """Base model with created_at and updated_at fields.
 
+    Both timestamps are filled in by the database, so inserts and bulk loads
+    can leave them out. They are None on instances that have not been
+    flushed yet; on flush they are read back with RETURNING, so no reload is
+    needed to see them.
+
     Attributes:
         created_at: The timestamp when the record was created.
         updated_at: The timestamp when the record was last updated.
     """
 
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    __mapper_args__ = {"eager_defaults": True}
+
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+    )
@@ -3,8 +3,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session
 
-from src.auth.dependencies import get_current_user
-from src.auth.models import User
+from src.auth.dependencies import CurrentUser
 from src.database import get_session
 from src.order.models import OrderCreate, OrderResponse
 from src.order.service import (
@@ -21,8 +20,8 @@ router = APIRouter(prefix="/orders", tags=["orders"])
 @router.post("/", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
 def create_order_endpoint(
     order_in: OrderCreate,
+    current_user: CurrentUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Creates a new order.
 
@@ -30,8 +29,8 @@ def create_order_endpoint(
 
     Args:
         order_in: The order data for creation.
-        session: The database session dependency.
         current_user: The authenticated user dependency.
+        session: The database session dependency.
 
     Raises:
         HTTPException: If any item quantity is invalid (not between 1 and 8).
@@ -52,9 +51,9 @@ def create_order_endpoint(
 
 @router.get("/", response_model=PageResponse[OrderResponse])
 def read_orders(
+    current_user: CurrentUser,
     pagination: PaginationParams = Depends(),
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Gets a paginated list of orders with optional filtering.
 
@@ -62,10 +61,10 @@ def read_orders(
     For admins, can return all orders or filter by user_id.
 
     Args:
+        current_user: The authenticated user dependency.
         pagination: The pagination parameters dependency.
         status: Optional filter by order status.
         session: The database session dependency.
-        current_user: The authenticated user dependency.
 
     Returns:
         A paginated response containing orders.
@@ -88,8 +87,8 @@ def read_orders(
 @router.get("/{order_id}", response_model=OrderResponse)
 def read_order(
     order_id: int,
+    current_user: CurrentUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Gets a specific order by ID.
 
@@ -97,8 +96,8 @@ def read_order(
 
     Args:
         order_id: The ID of the order to retrieve.
-        session: The database session dependency.
         current_user: The authenticated user dependency.
+        session: The database session dependency.
 
     Returns:
         The requested order.
@@ -115,8 +114,8 @@ def read_order(
 # def update_order_endpoint(
 #     order_id: int,
 #     order_in: OrderUpdate,
+#     current_user: CurrentUser,
 #     session: Session = Depends(get_session),
-#     current_user: User = Depends(get_current_user),
 # ) -> Any:
 #     """Updates an order.
 
@@ -125,8 +124,8 @@ def read_order(
 #     Args:
 #         order_id: The ID of the order to update.
 #         order_in: The order data to update.
-#         session: The database session dependency.
 #         current_user: The authenticated user dependency.
+#         session: The database session dependency.
 
 #     Returns:
 #         The updated order.
@@ -143,8 +142,8 @@ def read_order(
 # @router.post("/{order_id}/cancel", response_model=OrderResponse)
 # def cancel_order_endpoint(
 #     order_id: int,
+#     current_user: CurrentUser,
 #     session: Session = Depends(get_session),
-#     current_user: User = Depends(get_current_user),
 # ) -> Any:
 #     """Cancels an order.
 
@@ -153,8 +152,8 @@ def read_order(
 
 #     Args:
 #         order_id: The ID of the order to cancel.
-#         session: The database session dependency.
 #         current_user: The authenticated user dependency.
+#         session: The database session dependency.
 
 #     Returns:
 #         The cancelled order.
@@ -2,10 +2,9 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 
-import sqlmodel
 from sqlmodel import Session, select
 
-from src.book.service import get_book
+from src.book.service import get_book_model
 from src.discount.service import get_active_discount_for_book
 from src.exceptions import NotFoundError
 from src.order.exceptions import (
@@ -19,7 +18,7 @@ from src.order.models import (
     OrderItem,
     OrderItemCreate,
 )
-from src.pagination import PageResponse, PaginationParams
+from src.pagination import PageResponse, PaginationParams, paginate
 
 
 def create_order(session: Session, order_create: OrderCreate, user_id: int) -> Order:
@@ -45,7 +44,7 @@ def create_order(session: Session, order_create: OrderCreate, user_id: int) -> O
     order_items = []
 
     for item_create in order_create.items:
-        book = get_book(session=session, book_id=item_create.book_id)
+        book = get_book_model(session=session, book_id=item_create.book_id)
 
         # Check for active discount
         discount = get_active_discount_for_book(session=session, book_id=book.id)
@@ -139,17 +138,7 @@ def get_orders(
     # Order by most recent first
     statement = statement.order_by(Order.order_date.desc())
 
-    # Execute with pagination
-    results = session.exec(
-        statement.offset(pagination.offset).limit(pagination.page_size)
-    )
-    orders = results.all()
-
-    # Get total count for pagination
-    count_statement = select(sqlmodel.func.count()).select_from(statement.subquery())
-    total = session.exec(count_statement).one()
-
-    return PageResponse.create(items=orders, total=total, params=pagination)
+    return paginate(session, statement, pagination)
 
 
 # def update_order(
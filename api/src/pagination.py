@@ -1,7 +1,15 @@
-from typing import Generic, List, TypeVar
+import base64
+import binascii
+import json
+from decimal import Decimal, InvalidOperation
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
 
 from fastapi import Query
 from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Select, and_, or_, tuple_
+from sqlmodel import Session, func, select
+
+from src.exceptions import BadRequestError
 
 T = TypeVar("T")
 
@@ -42,6 +50,9 @@ class PageResponse(BaseModel, Generic[T]):
         page: The current page number.
         page_size: The number of items per page.
         pages: The total number of pages.
+        next_cursor: For endpoints supporting keyset pagination, the opaque
+                     cursor that fetches the page after this one, or None on
+                     the last page.
     """
 
     items: List[T]
@@ -49,10 +60,15 @@ class PageResponse(BaseModel, Generic[T]):
     page: int
     page_size: int
     pages: int
+    next_cursor: Optional[str] = None
 
     @classmethod
     def create(
-        cls, items: List[T], total: int, params: PaginationParams
+        cls,
+        items: List[T],
+        total: int,
+        params: PaginationParams,
+        next_cursor: Optional[str] = None,
     ) -> "PageResponse[T]":
         """Creates a PageResponse instance.
 
@@ -60,6 +76,7 @@ class PageResponse(BaseModel, Generic[T]):
             items: The list of items for the current page.
             total: The total number of items.
             params: The pagination parameters used for the request.
+            next_cursor: Optional keyset cursor for the next page.
 
         Returns:
             A PageResponse instance populated with pagination details.
@@ -71,4 +88,165 @@ class PageResponse(BaseModel, Generic[T]):
             page=params.page,
             page_size=params.page_size,
             pages=pages,
+            next_cursor=next_cursor,
+        )
+
+
+def paginate(
+    session: Session, statement: Select, pagination: PaginationParams
+) -> PageResponse:
+    """Fetches one page of a single-entity statement with its total.
+
+    The total rides along on every row as a window count, saving a separate
+    COUNT round trip. Only a page past the end, which has no rows to carry
+    it, counts separately.
+
+    Args:
+        session: The database session.
+        statement: The filtered and ordered statement selecting the items.
+        pagination: Pagination parameters.
+
+    Returns:
+        A paginated response containing the items of the page.
+    """
+    # `execute` keeps the rows whole; `exec` would reduce a statement built
+    # from a single entity to that entity and drop the total
+    rows = session.execute(
+        statement.add_columns(func.count().over().label("total"))
+        .offset(pagination.offset)
+        .limit(pagination.page_size)
+    ).all()
+    items = [row[0] for row in rows]
+    if rows:
+        total = rows[0].total
+    elif pagination.offset > 0:
+        count_statement = select(func.count()).select_from(
+            statement.order_by(None).subquery()
         )
+        total = session.exec(count_statement).one()
+    else:
+        total = 0
+
+    return PageResponse.create(items=items, total=total, params=pagination)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encodes the sort key of the last row on a page as an opaque cursor.
+
+    Args:
+        values: The values of the sort columns, in sort order. Values that are
+                not JSON types (e.g. Decimal) are encoded as strings.
+
+    Returns:
+        A URL-safe cursor string.
+    """
+    data = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    """Decodes a cursor created by `encode_cursor`.
+
+    Args:
+        cursor: The cursor string from the request.
+        length: The number of sort values the cursor must hold.
+
+    Returns:
+        The sort values, as decoded from JSON.
+
+    Raises:
+        BadRequestError: If the cursor is malformed.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (UnicodeError, binascii.Error, ValueError):
+        raise BadRequestError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != length:
+        raise BadRequestError("Invalid cursor")
+    return values
+
+
+# Bounds for cursor values, so a forged cursor cannot hold anything the
+# database would reject instead of compare: the BIGINT range for integers,
+# and far less than a Postgres numeric can hold for decimals
+_MIN_CURSOR_INT = -(2**63)
+_MAX_CURSOR_INT = 2**63 - 1
+_MAX_CURSOR_DECIMAL_DIGITS = 1000
+
+
+def _typed_cursor_value(value: Any, value_type: type) -> Any:
+    """Checks one decoded cursor value against the type of its sort key.
+
+    Decimals are carried as strings and converted; other values must already
+    have the JSON type matching `value_type`.
+
+    Raises:
+        BadRequestError: If the value does not fit the type.
+    """
+    if value_type is int:
+        # bool is a subclass of int, but never a valid key
+        if type(value) is int and _MIN_CURSOR_INT <= value <= _MAX_CURSOR_INT:
+            return value
+    elif value_type is str:
+        if isinstance(value, str) and "\x00" not in value:
+            return value
+    elif value_type is Decimal:
+        if isinstance(value, str):
+            try:
+                number = Decimal(value)
+            except InvalidOperation:
+                raise BadRequestError("Invalid cursor")
+            digits = number.as_tuple()
+            if (
+                number.is_finite()
+                and len(digits.digits) <= _MAX_CURSOR_DECIMAL_DIGITS
+                and abs(digits.exponent) <= _MAX_CURSOR_DECIMAL_DIGITS
+            ):
+                return number
+    raise BadRequestError("Invalid cursor")
+
+
+def decode_typed_cursor(cursor: str, types: Sequence[type]) -> List[Any]:
+    """Decodes a cursor and checks each value against its sort key type.
+
+    Args:
+        cursor: The cursor string from the request.
+        types: The type of each sort value, in sort order: `int`, `str` or
+               `Decimal`.
+
+    Returns:
+        The sort values, with decimals converted from their string form.
+
+    Raises:
+        BadRequestError: If the cursor is malformed or a value has the wrong
+                         type.
+    """
+    values = decode_cursor(cursor, len(types))
+    return [
+        _typed_cursor_value(value, value_type)
+        for value, value_type in zip(values, types)
+    ]
+
+
+def keyset_condition(
+    order: Sequence[Tuple[ColumnElement, bool]], values: Sequence[Any]
+) -> ColumnElement[bool]:
+    """Builds the condition matching rows that sort after the given key.
+
+    Args:
+        order: The sort expressions paired with whether they sort descending.
+        values: The sort key of the last row already returned.
+
+    Returns:
+        A condition for WHERE (or HAVING, for aggregate sort keys).
+    """
+    if not any(descending for _, descending in order):
+        # A row comparison lets Postgres seek straight into a matching index
+        return tuple_(*(expression for expression, _ in order)) > tuple_(*values)
+
+    clauses = []
+    for i, (expression, descending) in enumerate(order):
+        ties = [prior == value for (prior, _), value in zip(order[:i], values)]
+        after = expression < values[i] if descending else expression > values[i]
+        clauses.append(and_(*ties, after))
+    return or_(*clauses)
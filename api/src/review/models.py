@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Optional
 
 from pydantic import Field
-from sqlalchemy import BigInteger
+from sqlalchemy import BigInteger, Index
 from sqlmodel import Field, Relationship, SQLModel
 from pydantic import Field as PydanticField  # Alias pydantic Field to avoid conflict
 
@@ -62,6 +62,12 @@ class Review(ReviewBase, TimestampModel, table=True):
         book: Relationship to the book being reviewed.
     """
 
+    # Carries the rating, so the per-book rating statistics are computed
+    # from the index alone. It also serves the foreign key lookups on book
+    __table_args__ = (
+        Index("ix_review_book_id_rating", "book_id", postgresql_include=["rating"]),
+    )
+
     id: Optional[int] = Field(sa_type=BigInteger, default=None, primary_key=True)
 
     book: Book = Relationship()
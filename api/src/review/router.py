@@ -3,8 +3,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session
 
-from src.auth.dependencies import get_current_user
-from src.auth.models import User
+from src.auth.dependencies import CurrentUser
 from src.database import get_session
 from src.pagination import PageResponse, PaginationParams
 from src.review.models import (
@@ -36,8 +35,8 @@ def create_review_endpoint(
 
     Args:
         review_in: The review data for creation.
-        session: The database session dependency.
         current_user: The authenticated user dependency.
+        session: The database session dependency.
 
     Returns:
         The created review.
@@ -127,8 +126,8 @@ def read_review(
 def update_review_endpoint(
     review_id: int,
     review_in: ReviewUpdate,
+    current_user: CurrentUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """Updates a review.
 
@@ -137,8 +136,8 @@ def update_review_endpoint(
     Args:
         review_id: The ID of the review to update.
         review_in: The review data to update.
-        session: The database session dependency.
         current_user: The authenticated user dependency.
+        session: The database session dependency.
 
     Returns:
         The updated review.
@@ -154,8 +153,8 @@ def update_review_endpoint(
 @router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_review_endpoint(
     review_id: int,
+    current_user: CurrentUser,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
 ) -> None:
     """Deletes a review.
 
@@ -163,8 +162,8 @@ async def delete_review_endpoint(
 
     Args:
         review_id: The ID of the review to delete.
-        session: The database session dependency.
         current_user: The authenticated user dependency.
+        session: The database session dependency.
     """
     await delete_review(
         session=session,
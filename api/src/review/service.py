@@ -2,13 +2,12 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-import sqlmodel
 from fastapi import HTTPException, status
 from sqlmodel import Session, select
 from sqlalchemy import case, func
 
 from src.exceptions import NotFoundError
-from src.pagination import PageResponse, PaginationParams
+from src.pagination import PageResponse, PaginationParams, paginate
 from src.review.models import (
     BookRatingStatsResponse,
     Review,
@@ -116,13 +115,7 @@ def get_reviews(
     else:
         query = query.order_by(Review.review_date.desc())
 
-    total_count_query = select(sqlmodel.func.count()).select_from(query.subquery())
-    total_count = session.exec(total_count_query).one()
-
-    paginated_query = query.offset(pagination.offset).limit(pagination.page_size)
-    results = session.exec(paginated_query).all()
-
-    return PageResponse.create(items=results, total=total_count, params=pagination)
+    return paginate(session, query, pagination)
 
 
 def get_book_rating_stats(session: Session, book_id: int) -> BookRatingStatsResponse:
@@ -138,7 +131,7 @@ def get_book_rating_stats(session: Session, book_id: int) -> BookRatingStatsResp
     statement = (
         select(
             func.coalesce(func.avg(Review.rating), 0.0).label("average_rating"),
-            func.count(Review.id).label("total_reviews"),
+            func.count().label("total_reviews"),
             func.sum(case((Review.rating == 5, 1), else_=0)).label("five_stars"),
             func.sum(case((Review.rating == 4, 1), else_=0)).label("four_stars"),
             func.sum(case((Review.rating == 3, 1), else_=0)).label("three_stars"),
@@ -193,9 +186,8 @@ def update_review(
             detail="You can only update your own reviews",
         )
 
-    update_data = review_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(review, key, value)
+    for field in review_update.model_fields_set:
+        setattr(review, field, getattr(review_update, field))
     review.review_date = datetime.now()
     review.updated_at = datetime.now()
 
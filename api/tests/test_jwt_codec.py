@@ -0,0 +1,25 @@
+import jwt
+import pytest
+
+from src.auth.tokens import PreparedHMACAlgorithm, build_jwt_codec
+
+SECRET = "test-secret-that-is-long-enough-for-hs256"
+
+
+def test_round_trip_uses_prepared_key() -> None:
+    """Tokens encoded by the codec decode with it and with plain PyJWT."""
+    codec = build_jwt_codec(SECRET, "HS256")
+    token = codec.encode({"sub": "1"}, SECRET, algorithm="HS256")
+
+    assert isinstance(codec._jws.get_algorithm_by_name("HS256"), PreparedHMACAlgorithm)
+    assert codec.decode(token, SECRET, algorithms=["HS256"]) == {"sub": "1"}
+    assert jwt.decode(token, SECRET, algorithms=["HS256"]) == {"sub": "1"}
+
+
+def test_bad_signature_is_rejected() -> None:
+    """Tokens signed with another secret fail signature verification."""
+    codec = build_jwt_codec(SECRET, "HS256")
+    forged = jwt.encode({"sub": "1"}, "another-secret-of-sufficient-len", "HS256")
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        codec.decode(forged, SECRET, algorithms=["HS256"])
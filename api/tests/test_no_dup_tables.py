@@ -0,0 +1,15 @@
+from collections import Counter
+
+from sqlmodel import SQLModel
+
+import src.main  # noqa: F401  Imports every router, and with them every model
+
+
+def test_each_table_is_mapped_once() -> None:
+    """Every table is registered by exactly one model class."""
+    mapped_tables = Counter(
+        mapper.local_table.name for mapper in SQLModel._sa_registry.mappers
+    )
+
+    assert set(mapped_tables) == set(SQLModel.metadata.tables)
+    assert [name for name, count in mapped_tables.items() if count > 1] == []
@@ -91,6 +91,7 @@ export const AuthProvider = ({ children }: { children: ReactNode }) => {
       }
 
       localStorage.setItem('auth-token', receivedToken);
+      localStorage.setItem('auth-refresh-token', data.refresh_token);
       setToken(receivedToken); 
 
       const userResponse = await fetch(`${API_BASE_URL}/auth/me`, {
@@ -111,6 +112,7 @@ export const AuthProvider = ({ children }: { children: ReactNode }) => {
       console.error('Login error:', error);
       localStorage.removeItem('auth-token');
       localStorage.removeItem('auth-user');
+      localStorage.removeItem('auth-refresh-token');
       setToken(null); // Clear token on error
       setUser(null);
       throw error;
@@ -120,9 +122,10 @@ export const AuthProvider = ({ children }: { children: ReactNode }) => {
   };
 
   const logout = async () => { 
-    if (token) {
+    const storedRefreshToken = localStorage.getItem('auth-refresh-token');
+    if (token && storedRefreshToken) {
       try {
-        await bookwormApi.logout(token);
+        await bookwormApi.logout(token, storedRefreshToken);
         console.log('Successfully logged out on backend.');
       } catch (error) {
         console.error('Backend logout failed:', error);
@@ -138,12 +141,15 @@ export const AuthProvider = ({ children }: { children: ReactNode }) => {
 
   // TODO: Implement token refresh logic if needed
   const refreshToken = async () => { 
-    if (token) {
-      bookwormApi.refreshToken(token)
+    const storedRefreshToken = localStorage.getItem('auth-refresh-token');
+    if (storedRefreshToken) {
+      bookwormApi.refreshToken(storedRefreshToken)
         .then((data) => {
           const newToken = data.access_token;
           setToken(newToken);
           localStorage.setItem('auth-token', newToken);
+          // The old refresh token is revoked once it has been used
+          localStorage.setItem('auth-refresh-token', data.refresh_token);
         })
         .catch((error) => {
           console.error('Token refresh failed:', error);
@@ -109,6 +109,7 @@ export interface OrderResponse {
 /** API response structure for authentication tokens. */
 export interface Token {
   access_token: string;
+  refresh_token: string;
   token_type: string; // e.g., "Bearer"
 }
 
@@ -210,11 +210,12 @@ export const bookwormApi = {
     }
   },
 
-  logout: async (token: string): Promise<void> => {
+  logout: async (token: string, refreshToken: string): Promise<void> => {
     try {
       await ky.post(`${API_BASE_URL}/auth/logout`, {
         headers: {
           'Authorization': `Bearer ${token}`,
+          'refresh-token': refreshToken,
         },
       });
     } catch (error) {